@@ -1,22 +1,500 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from mpl_toolkits.mplot3d import Axes3D  # For 3D plotting
-import csv
-import json
 import numpy as np
-import requests  # For internet connectivity
-
-# Global constant and simulation steps
-C = 3e8  # Speed of light (m/s)
-TOTAL_STEPS = 100
+import functools
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from zahoor_engine import (TOTAL_STEPS, TRANSFORMATION_OPTIONS, HISTORICAL_OPTIONS, KINETICS, mass_to_energy,
+                           effective_fraction, RESULT_CACHE,
+                           parse_range, sweep_grid, monte_carlo, SimulationLog, export_csv, export_json, export_npy,
+                           load_npy, decimate_minmax, upload_log, UploadInterrupted, JobRunner,
+                           StepPublisher, STREAM_PORT, DataPlane, SharedLogMirror)
 
 # Global theme flag
 DARK_MODE = False
 
+THEMES = {
+    "light": {"bg": "#f0f0f0", "fg": "#000000", "field": "#ffffff", "axes": "#ffffff", "select": "#0078d7"},
+    "dark": {"bg": "#2e2e2e", "fg": "#ffffff", "field": "#3c3c3c", "axes": "#383838", "select": "#3a6ea5"},
+}
+
+# Simulation pacing: steps advance on a fixed timestep, the screen refreshes at most once per frame
+FRAME_INTERVAL_MS = 16
+SPEED_OPTIONS = {"0.5x": 0.5, "1x": 1.0, "2x": 2.0, "5x": 5.0, "10x": 10.0, "100x": 100.0, "Max": None}
+
+# Base URL for the Network Simulation tab (point it at a local server for testing)
+DEFAULT_ENDPOINT = os.environ.get("ZAHOOR_ENDPOINT", "https://httpbin.org")
+
+# Local port for Tools > Live Stream (subscribe with: python zahoor_engine.py subscribe)
+LIVE_STREAM_PORT = int(os.environ.get("ZAHOOR_STREAM_PORT", STREAM_PORT))
+# Shared memory block for Tools > Shared Data Buffer (attach with zahoor_engine.SharedLogReader)
+SHARED_BUFFER_NAME = os.environ.get("ZAHOOR_SHARED_NAME", "zahoor_run")
+
+# ==================== Instrumentation ====================
+class Profiler:
+    # Ring buffers of callback durations, frame intervals and memory samples; recording is off
+    # unless ZAHOOR_PROFILE=1 is set or the overlay is switched on, so the hooks cost one flag check
+    def __init__(self, capacity=4096):
+        self.enabled = os.environ.get("ZAHOOR_PROFILE") == "1"
+        self.samples = deque(maxlen=capacity)  # (wall time, name, seconds)
+        self.memory = deque(maxlen=capacity)  # (wall time, resident MB)
+        self.memory_is_peak = False  # True when only the peak RSS is available on this platform
+        self.last_frame = None
+        
+    def record(self, name, seconds):
+        self.samples.append((time.time(), name, seconds))
+        
+    def frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_frame is not None and now - self.last_frame < 1.0:  # Gaps are idle time, not slow frames
+            self.record("frame", now - self.last_frame)
+        self.last_frame = now
+        
+    def sample_memory(self):
+        rss, self.memory_is_peak = resident_memory_mb()
+        if rss is not None:
+            self.memory.append((time.time(), rss))
+        return rss
+        
+    def summary(self):
+        durations = {}
+        for _, name, seconds in self.samples:
+            durations.setdefault(name, []).append(seconds)
+        stats = {}
+        for name, values in durations.items():
+            ms = np.array(values) * 1000
+            stats[name] = {"count": len(ms), "mean_ms": float(ms.mean()),
+                           "p95_ms": float(np.percentile(ms, 95)), "max_ms": float(ms.max())}
+        return stats
+        
+    def dump(self, path):
+        with open(path, "w") as file:
+            json.dump({"summary": self.summary(),
+                       "samples": [{"time": t, "name": n, "ms": sec * 1000} for t, n, sec in self.samples],
+                       "memory_mb": [{"time": t, "rss": rss} for t, rss in self.memory],
+                       "memory_is_peak": self.memory_is_peak}, file, indent=2)
+
+def resident_memory_mb():
+    # Returns (MB, is_peak); without /proc only the peak RSS is available
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20, False
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None, False
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == "darwin" else 1024), True  # Bytes on macOS, KB elsewhere
+
+PROFILER = Profiler()
+
+def profiled(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+class ProfilerOverlay:
+    # Small always-on-top readout in the corner of the main window
+    def __init__(self, root, profiler, interval=500):
+        self.root = root
+        self.profiler = profiler
+        self.interval = interval
+        self.label = None
+        self.after_id = None
+        
+    def toggle(self):
+        if self.label is None:
+            self.profiler.enabled = True
+            self.label = tk.Label(self.root, font=("Courier", 9), justify="left", anchor="nw",
+                                  bg="#000000", fg="#00ff00")
+            self.label.place(relx=1.0, rely=0.0, anchor="ne")
+            self.refresh()
+        else:
+            if self.after_id is not None:
+                self.root.after_cancel(self.after_id)
+                self.after_id = None
+            self.label.destroy()
+            self.label = None
+            
+    def refresh(self):
+        if self.label is None:
+            return
+        rss = self.profiler.sample_memory()
+        stats = self.profiler.summary()
+        frame = stats.get("frame")
+        lines = [f"FPS {1000 / frame['mean_ms']:.0f}" if frame else "FPS -",
+                 f"{'Peak RSS' if self.profiler.memory_is_peak else 'RSS'} {rss:.0f} MB" if rss is not None
+                 else "RSS -"]
+        for name, stat in sorted(stats.items(), key=lambda item: -item[1]["mean_ms"])[:6]:
+            lines.append(f"{name:<24} {stat['mean_ms']:7.2f} ms  p95 {stat['p95_ms']:7.2f}")
+        self.label.config(text="\n".join(lines))
+        self.label.lift()
+        self.after_id = self.root.after(self.interval, self.refresh)
+
+# ==================== Rendering Helpers ====================
+def create_figure_canvas(parent, figsize, projection=None):
+    # matplotlib is imported on first use so app start-up doesn't pay for it
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    if projection == '3d':
+        from mpl_toolkits.mplot3d import Axes3D  # For 3D plotting (registers the projection)
+    fig = Figure(figsize=figsize, dpi=100)
+    ax = fig.add_subplot(111, projection=projection)
+    canvas = FigureCanvasTkAgg(fig, master=parent)
+    canvas.get_tk_widget().pack(pady=10)
+    return fig, ax, canvas
+
+def draw_scatter_points(ax, log, idx):
+    energy_scaled = log.column("energy")[idx] / 1e16  # Scale energy for display
+    return ax.scatter(log.column("step")[idx], log.column("remaining")[idx], energy_scaled, c='purple', marker='o')
+
+def format_log_row(row):
+    return (row[0], f"{row[1]:.2f}", f"{row[2]:.2f}", f"{row[3]:.2e}")
+
+class BlitManager:
+    # Redraws only the registered (animated) artists over a cached background
+    def __init__(self, canvas, artists=()):
+        self.canvas = canvas
+        self.background = None
+        self.artists = []
+        for artist in artists:
+            self.add_artist(artist)
+        self.cid = canvas.mpl_connect("draw_event", self.on_draw)
+        
+    def add_artist(self, artist):
+        artist.set_animated(True)
+        self.artists.append(artist)
+        
+    def on_draw(self, event):
+        # Any full draw (first show, resize, rescale) refreshes the cached background
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_artists()
+        
+    def draw_artists(self):
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+            
+    @profiled("canvas.draw")
+    def full_redraw(self):
+        self.background = None
+        self.canvas.draw()
+        
+    @profiled("canvas.blit")
+    def update(self):
+        if self.background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+class LiveBarChart:
+    # Bars and value labels are created once; frames only change heights and text
+    def __init__(self, ax, canvas, categories, colors, headroom=1.15):
+        self.ax = ax
+        self.headroom = headroom
+        self.bars = list(ax.bar(categories, [0] * len(categories), color=colors))
+        self.labels = [ax.text(bar.get_x() + bar.get_width()/2, 0, "", ha='center', va='bottom') for bar in self.bars]
+        self.blitter = BlitManager(canvas, self.bars + self.labels + [ax.title])
+        
+    def fit_limits(self, values):
+        low = min(0, min(values)) * self.headroom
+        high = max(0, max(values)) * self.headroom
+        self.ax.set_ylim(low, high if high > low else low + 1)
+        
+    def update(self, values, title=None, rescale=False):
+        if title is not None:
+            self.ax.title.set_text(title)
+        for bar, label, h in zip(self.bars, self.labels, values):
+            bar.set_height(h)
+            label.set_y(h)
+            label.set_text(f"{h:.2f}")
+        low, high = self.ax.get_ylim()
+        if rescale or min(values) < low or max(values) > high:
+            self.fit_limits(values)
+            self.blitter.full_redraw()
+        else:
+            self.blitter.update()
+            
+    def reset(self):
+        for bar, label in zip(self.bars, self.labels):
+            bar.set_height(0)
+            label.set_text("")
+        self.ax.title.set_text("")
+        self.blitter.full_redraw()
+
+class LiveLineChart:
+    # A single persistent Line2D whose data is swapped in place each frame
+    def __init__(self, ax, canvas, **line_kwargs):
+        self.ax = ax
+        self.line, = ax.plot([], [], **line_kwargs)
+        self.blitter = BlitManager(canvas, [self.line])
+        
+    def set_limits(self, xlim, ylim):
+        self.ax.set_xlim(*xlim)
+        self.ax.set_ylim(*ylim)
+        self.blitter.full_redraw()
+        
+    def update(self, x, y):
+        self.line.set_data(x, y)
+        self.blitter.update()
+
+class SimulationClock:
+    # Fixed-timestep clock: wall time (times the speed multiplier) decides how many steps are due,
+    # so a slow redraw makes the display skip steps instead of slowing the simulation down
+    def __init__(self, step_interval, max_steps_per_tick=10000):
+        self.step_interval = step_interval  # Seconds per step at 1x
+        self.max_steps_per_tick = max_steps_per_tick
+        self.speed = 1.0  # None runs as fast as possible
+        self.start()
+        
+    def start(self):
+        self.last_tick = time.perf_counter()
+        self.accumulator = self.step_interval  # The first step is due immediately
+        
+    def resume(self):
+        self.last_tick = time.perf_counter()  # Time spent paused doesn't count
+        
+    def due_steps(self):
+        now = time.perf_counter()
+        elapsed, self.last_tick = now - self.last_tick, now
+        if self.speed is None:
+            return self.max_steps_per_tick
+        self.accumulator += elapsed * self.speed
+        steps = int(self.accumulator / self.step_interval)
+        self.accumulator -= steps * self.step_interval
+        return min(steps, self.max_steps_per_tick)
+
+class ThemeManager:
+    # Widgets and figures are registered once (recursively, as each tab is built); switching theme
+    # then only replays a cached option map per widget class plus one configure per ttk style
+    TK_OPTIONS = {
+        tk.Tk: ("bg",),
+        tk.Toplevel: ("bg",),
+        tk.Frame: ("bg",),
+        tk.Label: ("bg", "fg"),
+        tk.Button: ("bg", "fg", "activebackground", "activeforeground"),
+        tk.Entry: ("field", "fg", "insertbackground"),
+        tk.Text: ("field", "fg", "insertbackground"),
+    }
+    OPTION_NAMES = {"bg": "background", "fg": "foreground", "field": "background"}
+    
+    def __init__(self, root):
+        self.root = root
+        self.style = ttk.Style(root)
+        self.widgets = []
+        self.figures = []
+        self.option_cache = {}
+        self.pinned = {}  # str(widget) -> options the widget set itself, which no theme overrides
+        self.current = "light"
+        
+    def register_tree(self, widget):
+        new_widgets = []
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            stack.extend(w.winfo_children())
+            if type(w) in self.TK_OPTIONS:
+                self.pin_explicit(w)
+                new_widgets.append(w)
+        self.widgets.extend(new_widgets)
+        return new_widgets
+        
+    def pin_explicit(self, widget):
+        # A colour that differs from the Tk default was chosen on purpose (e.g. a green result label)
+        pinned = set()
+        for name in self.TK_OPTIONS[type(widget)]:
+            info = widget.configure(self.OPTION_NAMES.get(name, name))
+            if str(info[-1]) != str(info[-2]):
+                pinned.add("bg" if name == "field" else name)
+        if pinned:
+            self.pinned[str(widget)] = pinned
+        
+    def register_figure(self, fig, canvas):
+        self.figures.append((fig, canvas))
+        
+    def options_for(self, widget_class, theme):
+        key = (widget_class, theme)
+        if key not in self.option_cache:
+            colors = THEMES[theme]
+            options = {}
+            for name in self.TK_OPTIONS[widget_class]:
+                if name == "field":
+                    options["bg"] = colors["field"]
+                elif name in ("bg", "activebackground"):
+                    options[name] = colors["bg"]
+                else:
+                    options[name] = colors["fg"]
+            self.option_cache[key] = options
+        return self.option_cache[key]
+        
+    def apply(self, theme, widgets=None, figures=None):
+        self.current = theme
+        colors = THEMES[theme]
+        for widget in self.widgets if widgets is None else widgets:
+            options = self.options_for(type(widget), theme)
+            pinned = self.pinned.get(str(widget))
+            if pinned:
+                options = {name: value for name, value in options.items() if name not in pinned}
+            widget.config(**options)
+        self.style.configure("TFrame", background=colors["bg"])
+        self.style.configure("TNotebook", background=colors["bg"])
+        self.style.configure("TNotebook.Tab", background=colors["bg"], foreground=colors["fg"])
+        self.style.configure("Treeview", background=colors["field"], fieldbackground=colors["field"],
+                             foreground=colors["fg"])
+        self.style.configure("Treeview.Heading", background=colors["bg"], foreground=colors["fg"])
+        self.style.map("Treeview", background=[("selected", colors["select"])])
+        for fig, canvas in self.figures if figures is None else figures:
+            self.apply_figure(fig, colors)
+            canvas.draw_idle()
+            
+    def apply_figure(self, fig, colors):
+        fig.set_facecolor(colors["bg"])
+        for ax in fig.axes:
+            ax.set_facecolor(colors["axes"])
+            ax.title.set_color(colors["fg"])
+            for text in ax.texts:
+                text.set_color(colors["fg"])
+            for axis in (getattr(ax, name, None) for name in ("xaxis", "yaxis", "zaxis")):
+                if axis is not None:
+                    axis.label.set_color(colors["fg"])
+                    axis.set_tick_params(colors=colors["fg"])
+            for spine in ax.spines.values():
+                spine.set_edgecolor(colors["fg"])
+
+class UiUpdateQueue:
+    # Coalesces widget updates: only the latest value per target is applied, once per frame
+    def __init__(self, root, interval=16):
+        self.root = root
+        self.interval = interval
+        self.pending = {}
+        self.scheduled = None
+        
+    def post(self, key, func, *args):
+        self.pending[key] = (func, args)
+        if self.scheduled is None:
+            self.scheduled = self.root.after(self.interval, self.flush)
+            
+    def config(self, widget, **options):
+        self.post((str(widget), tuple(sorted(options))), lambda: widget.config(**options))
+        
+    def set_var(self, var, value):
+        self.post(str(var), var.set, value)
+        
+    @profiled("ui.flush")
+    def flush(self):
+        PROFILER.frame()
+        if self.scheduled is not None:
+            self.root.after_cancel(self.scheduled)
+            self.scheduled = None
+        pending, self.pending = self.pending, {}
+        for func, args in pending.values():
+            func(*args)
+
+class VirtualTable:
+    # Treeview that only formats and shows the rows inside the viewport;
+    # a fixed pool of items is reused as the user scrolls through the data
+    def __init__(self, parent, columns, formatter, page_size=20):
+        self.frame = tk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=[c[0] for c in columns], show="headings", height=page_size)
+        for name, heading, width in columns:
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=width)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.on_scroll)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.formatter = formatter
+        self.page_size = page_size
+        self.data = None
+        self.row_count = 0
+        self.offset = 0
+        self.items = []
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_to(self.offset - int(e.delta / 120) * 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.offset - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.offset + 3))
+        
+    def set_source(self, data):
+        if data is self.data and len(data) >= self.row_count:
+            self.refresh()
+            return
+        self.data = data
+        self.row_count = len(data)
+        self.offset = 0
+        self.render()
+        
+    def refresh(self):
+        # Incremental: rows added since the last refresh only cost a render if they land in the viewport
+        old_count = self.row_count
+        self.row_count = len(self.data) if self.data is not None else 0
+        if self.row_count == old_count:
+            return
+        if old_count >= self.page_size and self.offset + self.page_size >= old_count:
+            self.offset = self.row_count - self.page_size  # Viewport was pinned to the tail, keep following
+            self.render()
+        elif old_count < self.offset + self.page_size:
+            self.render()
+        else:
+            self.update_scrollbar()
+            
+    @profiled("table.render")
+    def render(self):
+        rows = self.data.rows(self.offset, self.offset + self.page_size) if self.data is not None else []
+        while len(self.items) < len(rows):
+            self.items.append(self.tree.insert("", "end"))
+        while len(self.items) > len(rows):
+            self.tree.delete(self.items.pop())
+        for item, row in zip(self.items, rows):
+            self.tree.item(item, values=self.formatter(row))
+        self.update_scrollbar()
+        
+    def update_scrollbar(self):
+        if self.row_count:
+            self.scrollbar.set(self.offset / self.row_count, min(1.0, (self.offset + self.page_size) / self.row_count))
+        else:
+            self.scrollbar.set(0, 1)
+            
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), self.row_count - self.page_size))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+            
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.row_count)
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(amount) * self.page_size)
+        else:
+            self.scroll_to(self.offset + int(amount))
+            
+    def on_resize(self, event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        page_size = max(1, (event.height - row_height) // row_height)  # Minus the heading row
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.offset = max(0, min(self.offset, self.row_count - self.page_size))
+            self.render()
+
 # ==================== Tab 1: Mass-Energy Conversion ====================
 class MassEnergyConversionTab:
     def __init__(self, parent, app):
@@ -31,27 +509,20 @@ class MassEnergyConversionTab:
         self.result_label = tk.Label(parent, text="Energy: ", font=("Arial", 16), fg="green")
         self.result_label.pack(pady=5)
         
-        self.fig, self.ax = plt.subplots(figsize=(5, 3))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
-        self.canvas.get_tk_widget().pack(pady=10)
+        self.fig, self.ax, self.canvas = create_figure_canvas(parent, figsize=(5, 3))
+        self.chart = LiveBarChart(self.ax, self.canvas, ["Mass (kg)", "Energy (scaled)"], ["blue", "red"])
         
+    @profiled("mass_energy.convert")
     def convert(self):
         try:
             mass = float(self.entry.get())
             if mass <= 0:
                 messagebox.showerror("Input Error", "Mass must be positive.")
                 return
-            energy = mass * (C ** 2)
+            energy = mass_to_energy(mass)
             self.result_label.config(text=f"Energy: {energy:.2e} Joules")
-            self.ax.clear()
-            categories = ["Mass (kg)", "Energy (scaled)"]
             values = [mass, energy / 1e16]  # Energy scaled for visualization
-            bars = self.ax.bar(categories, values, color=["blue", "red"])
-            for bar in bars:
-                h = bar.get_height()
-                self.ax.text(bar.get_x() + bar.get_width()/2, h, f"{h:.2f}", ha='center', va='bottom')
-            self.ax.set_title("Mass-Energy Conversion (E=mc²)")
-            self.canvas.draw()
+            self.chart.update(values, title="Mass-Energy Conversion (E=mc²)", rescale=True)
             self.app.update_status("Mass-Energy conversion completed.")
         except ValueError:
             messagebox.showerror("Input Error", "Enter a valid number.")
@@ -65,9 +536,10 @@ class AdvancedMassConservationTrackerTab:
         self.paused = False
         self.step = 0
         self.total_steps = TOTAL_STEPS
-        self.sim_data = []
+        self.sim_data = SimulationLog()
+        self.played_specs = set()  # Specs this tab has replayed to the end; the result cache is shared with others
         
-        self.transformation_options = {"Decay": 0.9, "Burn": 0.7, "Fusion": 0.5, "Explosion": 0.2, "Nuclear Fusion": 0.3}
+        self.transformation_options = dict(TRANSFORMATION_OPTIONS)
         
         input_frame = tk.Frame(parent)
         input_frame.pack(pady=5)
@@ -81,6 +553,10 @@ class AdvancedMassConservationTrackerTab:
         self.mass_entry = tk.Entry(input_frame, font=("Arial", 14), width=10)
         self.mass_entry.grid(row=0, column=3, padx=5, pady=5)
         self.mass_entry.insert(0, "70")
+        tk.Label(input_frame, text="Kinetics:", font=("Arial", 14)).grid(row=0, column=4, padx=5, pady=5)
+        self.kinetics_var = tk.StringVar(value="Linear")
+        ttk.Combobox(input_frame, textvariable=self.kinetics_var, values=list(KINETICS), state="readonly",
+                     font=("Arial", 14), width=16).grid(row=0, column=5, padx=5, pady=5)
         
         tk.Label(input_frame, text="Reaction Rate (%):", font=("Arial", 14)).grid(row=1, column=0, padx=5, pady=5)
         self.rate_entry = tk.Entry(input_frame, font=("Arial", 14), width=10)
@@ -95,6 +571,39 @@ class AdvancedMassConservationTrackerTab:
         self.pressure_entry.grid(row=1, column=5, padx=5, pady=5)
         self.pressure_entry.insert(0, "1")
         
+        sweep_frame = tk.Frame(parent)
+        sweep_frame.pack(pady=5)
+        tk.Label(sweep_frame, text="Sweep (min,max,count) Rate:", font=("Arial", 12)).grid(row=0, column=0, padx=5)
+        self.sweep_rate_entry = tk.Entry(sweep_frame, font=("Arial", 12), width=12)
+        self.sweep_rate_entry.grid(row=0, column=1, padx=5)
+        self.sweep_rate_entry.insert(0, "50,150,101")
+        tk.Label(sweep_frame, text="Temp:", font=("Arial", 12)).grid(row=0, column=2, padx=5)
+        self.sweep_temp_entry = tk.Entry(sweep_frame, font=("Arial", 12), width=12)
+        self.sweep_temp_entry.grid(row=0, column=3, padx=5)
+        self.sweep_temp_entry.insert(0, "200,400,101")
+        tk.Label(sweep_frame, text="Pressure:", font=("Arial", 12)).grid(row=0, column=4, padx=5)
+        self.sweep_pressure_entry = tk.Entry(sweep_frame, font=("Arial", 12), width=12)
+        self.sweep_pressure_entry.grid(row=0, column=5, padx=5)
+        self.sweep_pressure_entry.insert(0, "0.5,2,101")
+        self.sweep_btn = tk.Button(sweep_frame, text="Run Sweep", font=("Arial", 12), command=self.run_sweep)
+        self.sweep_btn.grid(row=0, column=6, padx=5)
+        self.sweep_result = None
+        
+        mc_frame = tk.Frame(parent)
+        mc_frame.pack(pady=5)
+        tk.Label(mc_frame, text="Monte Carlo Uncertainty (±%):", font=("Arial", 12)).grid(row=0, column=0, padx=5)
+        self.mc_spread_entry = tk.Entry(mc_frame, font=("Arial", 12), width=6)
+        self.mc_spread_entry.grid(row=0, column=1, padx=5)
+        self.mc_spread_entry.insert(0, "10")
+        tk.Label(mc_frame, text="Runs:", font=("Arial", 12)).grid(row=0, column=2, padx=5)
+        self.mc_runs_entry = tk.Entry(mc_frame, font=("Arial", 12), width=8)
+        self.mc_runs_entry.grid(row=0, column=3, padx=5)
+        self.mc_runs_entry.insert(0, "20000")
+        self.mc_btn = tk.Button(mc_frame, text="Run Monte Carlo", font=("Arial", 12), command=self.run_monte_carlo)
+        self.mc_btn.grid(row=0, column=4, padx=5)
+        self.mc_result = None
+        self.mc_window = None
+        
         btn_frame = tk.Frame(parent)
         btn_frame.pack(pady=10)
         self.start_btn = tk.Button(btn_frame, text="Start Simulation", font=("Arial", 14), command=self.start_simulation)
@@ -105,83 +614,280 @@ class AdvancedMassConservationTrackerTab:
         self.resume_btn.grid(row=0, column=2, padx=5)
         self.reset_btn = tk.Button(btn_frame, text="Reset", font=("Arial", 14), command=self.reset_simulation, state="disabled")
         self.reset_btn.grid(row=0, column=3, padx=5)
+        self.queue_btn = tk.Button(btn_frame, text="Add to Queue", font=("Arial", 14), command=self.queue_job)
+        self.queue_btn.grid(row=0, column=4, padx=5)
+        self.run_queue_btn = tk.Button(btn_frame, text="Run Queue (0)", font=("Arial", 14), command=self.run_queue, state="disabled")
+        self.run_queue_btn.grid(row=0, column=5, padx=5)
+        tk.Label(btn_frame, text="Speed:", font=("Arial", 14)).grid(row=0, column=6, padx=5)
+        self.speed_var = tk.StringVar(value="1x")
+        ttk.Combobox(btn_frame, textvariable=self.speed_var, values=list(SPEED_OPTIONS), state="readonly",
+                     font=("Arial", 14), width=5).grid(row=0, column=7, padx=5)
+        self.clock = SimulationClock(step_interval=0.05)
+        self.job_queue = []
+        self.job_results = []
         
         self.progress = ttk.Progressbar(parent, orient="horizontal", mode="determinate", maximum=self.total_steps, length=400)
         self.progress.pack(pady=5)
         self.result_label = tk.Label(parent, text="", font=("Arial", 16))
         self.result_label.pack(pady=5)
         
-        self.fig, self.ax = plt.subplots(figsize=(5,3))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
-        self.canvas.get_tk_widget().pack(pady=10)
+        self.fig, self.ax, self.canvas = create_figure_canvas(parent, figsize=(5,3))
+        self.chart = LiveBarChart(self.ax, self.canvas, ["Initial", "Remaining", "Converted"], ["blue", "green", "red"])
         
-    def start_simulation(self):
+    def read_job_spec(self):
         try:
-            self.initial_mass = float(self.mass_entry.get())
-            self.base_fraction = self.transformation_options[self.transformation_var.get()]
-            self.reaction_rate = float(self.rate_entry.get())
-            self.temperature = float(self.temp_entry.get())
-            self.pressure = float(self.pressure_entry.get())
+            spec = {"kind": "advanced",
+                    "initial_mass": float(self.mass_entry.get()),
+                    "transformation": self.transformation_var.get(),
+                    "reaction_rate": float(self.rate_entry.get()),
+                    "temperature": float(self.temp_entry.get()),
+                    "pressure": float(self.pressure_entry.get()),
+                    "total_steps": self.total_steps,
+                    "kinetics": self.kinetics_var.get()}
         except ValueError:
             messagebox.showerror("Input Error", "Enter valid numbers for all parameters.")
-            return
-        if self.initial_mass <= 0:
+            return None
+        if spec["initial_mass"] <= 0:
             messagebox.showerror("Input Error", "Initial mass must be positive.")
+            return None
+        return spec
+        
+    def start_simulation(self):
+        spec = self.read_job_spec()
+        if spec is None:
             return
-        if self.transformation_var.get() == "Nuclear Fusion":
-            self.effective_fraction = 0.3 * (self.reaction_rate / 100)
-        else:
-            self.effective_fraction = self.base_fraction * (self.reaction_rate / 100) * (self.temperature / 300) * (self.pressure / 1)
-            if self.effective_fraction > 1:
-                self.effective_fraction = 1
+        self.initial_mass = spec["initial_mass"]
+        self.base_fraction = self.transformation_options[spec["transformation"]]
+        self.reaction_rate = spec["reaction_rate"]
+        self.temperature = spec["temperature"]
+        self.pressure = spec["pressure"]
+        self.effective_fraction = effective_fraction(self.transformation_var.get(), self.base_fraction,
+                                                     self.reaction_rate, self.temperature, self.pressure)
         self.target_mass = self.initial_mass * self.effective_fraction
         self.current_mass = self.initial_mass
-        self.delta = (self.initial_mass - self.target_mass) / self.total_steps
+        # The whole run is precomputed (or fetched from the result cache); animate() only replays it
+        run = (self.initial_mass, self.target_mass, self.total_steps, spec["kinetics"], self.temperature)
+        self.run_spec = tuple(spec.items())
+        self.trajectory = RESULT_CACHE.trajectory(*run)
         self.step = 0
-        self.sim_data = []
+        self.sim_data = SimulationLog(self.total_steps + 1)
         self.running = True
         self.paused = False
-        self.progress['value'] = 0
+        self.app.ui_updates.config(self.progress, value=0)
+        # Fix the axis range for the whole run so every frame can be blitted
+        _, remaining_col, converted_col, _ = self.trajectory
+        self.chart.fit_limits([self.initial_mass, remaining_col.min(), remaining_col.max(),
+                               converted_col.min(), converted_col.max()])
+        self.chart.blitter.full_redraw()
         self.start_btn.config(state="disabled")
         self.pause_btn.config(state="normal")
         self.reset_btn.config(state="normal")
+        if self.run_spec in self.played_specs:
+            self.show_cached_result()
+            return
         self.app.update_status("Advanced Mass Tracker: Simulation started.")
+        self.clock.start()
         self.animate()
         
+    def show_cached_result(self):
+        # This tab already played the same spec to the end: jump straight to the final frame
+        self.sim_data = SimulationLog.from_columns(*self.trajectory)
+        self.step, self.current_mass, converted, energy = self.sim_data[-1]
+        self.app.ui_updates.post(self.chart, self.chart.update, [self.initial_mass, self.current_mass, converted],
+                                 f"{self.transformation_var.get()} (Step {self.step}/{self.total_steps})")
+        self.app.ui_updates.config(self.result_label,
+                                   text=f"Remaining Mass: {self.current_mass:.2f} kg | Energy: {energy:.2e} J")
+        self.app.ui_updates.config(self.progress, value=self.total_steps)
+        self.finish_simulation("Advanced Tracker: Result loaded from cache.")
+        
+    @profiled("advanced.animate")
     def animate(self):
         if not self.running:
             return
         if self.paused:
             self.parent.after(100, self.animate)
             return
-        if self.step <= self.total_steps:
-            self.current_mass = self.initial_mass - self.delta * self.step
-            if self.current_mass < self.target_mass:
-                self.current_mass = self.target_mass
-            converted = self.initial_mass - self.current_mass
-            energy = converted * (C ** 2)
-            self.sim_data.append((self.step, self.current_mass, converted, energy))
-            self.ax.clear()
-            categories = ["Initial", "Remaining", "Converted"]
-            values = [self.initial_mass, self.current_mass, converted]
-            bars = self.ax.bar(categories, values, color=["blue", "green", "red"])
-            for bar in bars:
-                h = bar.get_height()
-                self.ax.text(bar.get_x() + bar.get_width()/2, h, f"{h:.2f}", ha='center', va='bottom')
-            self.ax.set_title(f"{self.transformation_var.get()} (Step {self.step}/{self.total_steps})")
-            self.canvas.draw()
-            self.result_label.config(text=f"Remaining Mass: {self.current_mass:.2f} kg | Energy: {energy:.2e} J")
-            self.progress['value'] = self.step
-            self.step += 1
+        self.clock.speed = SPEED_OPTIONS[self.speed_var.get()]
+        due = self.clock.due_steps()
+        if due:
+            # Every due step is logged, but only the last one of the batch is drawn
+            end = min(self.step + due, self.total_steps + 1)
+            steps_col, remaining_col, converted_col, energy_col = self.trajectory
+            self.sim_data.extend(steps_col[self.step:end], remaining_col[self.step:end],
+                                 converted_col[self.step:end], energy_col[self.step:end])
+            last = end - 1
+            self.current_mass = float(remaining_col[last])
+            converted = float(converted_col[last])
+            energy = float(energy_col[last])
+            self.app.ui_updates.post(self.chart, self.chart.update, [self.initial_mass, self.current_mass, converted],
+                                     f"{self.transformation_var.get()} (Step {last}/{self.total_steps})")
+            self.app.ui_updates.config(self.result_label,
+                                       text=f"Remaining Mass: {self.current_mass:.2f} kg | Energy: {energy:.2e} J")
+            self.app.ui_updates.config(self.progress, value=last)
+            self.step = end
             self.app.update_status(f"Advanced Tracker: Step {self.step}/{self.total_steps}")
-            self.parent.after(50, self.animate)
+        if self.step <= self.total_steps:
+            self.parent.after(FRAME_INTERVAL_MS, self.animate)
         else:
-            self.running = False
-            self.pause_btn.config(state="disabled")
-            self.resume_btn.config(state="disabled")
-            self.app.update_status("Advanced Tracker: Simulation completed.")
-            self.parent.bell()
+            self.played_specs.add(self.run_spec)
+            self.finish_simulation("Advanced Tracker: Simulation completed.")
+            
+    def finish_simulation(self, status):
+        self.running = False
+        self.pause_btn.config(state="disabled")
+        self.resume_btn.config(state="disabled")
+        self.app.update_status(status)
+        self.parent.bell()
+            
+    def queue_job(self):
+        spec = self.read_job_spec()
+        if spec is None:
+            return
+        self.job_queue.append(spec)
+        self.run_queue_btn.config(text=f"Run Queue ({len(self.job_queue)})", state="normal")
+        self.app.update_status(f"Advanced Tracker: {spec['transformation']} run queued ({len(self.job_queue)} pending).")
+        
+    def run_queue(self):
+        specs, self.job_queue = self.job_queue, []
+        self.run_queue_btn.config(text="Run Queue (0)", state="disabled")
+        self.queue_btn.config(state="disabled")
+        self.app.run_jobs(specs, self.queue_finished)
+        
+    def queue_finished(self, specs, results):
+        self.queue_btn.config(state="normal")
+        self.job_results = list(zip(specs, results))
+        failed = sum(isinstance(result, Exception) for result in results)
+        lines = [f"Queue: {len(results) - failed}/{len(results)} runs completed."]
+        for spec, result in self.job_results[:5]:
+            if isinstance(result, Exception):
+                lines.append(f"{spec['transformation']}: error: {result}")
+            else:
+                lines.append(f"{spec['transformation']}: Remaining {result[-1][1]:.2f} kg | Energy {result[-1][3]:.2e} J")
+        self.app.ui_updates.config(self.result_label, text="\n".join(lines))
+        
+    def run_sweep(self):
+        try:
+            initial_mass = float(self.mass_entry.get())
+            rates = parse_range(self.sweep_rate_entry.get())
+            temperatures = parse_range(self.sweep_temp_entry.get())
+            pressures = parse_range(self.sweep_pressure_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Sweep Error", f"Enter ranges as min,max,count.\n{e}")
+            return
+        if initial_mass <= 0:
+            messagebox.showerror("Input Error", "Initial mass must be positive.")
+            return
+        self.sweep_btn.config(state="disabled")
+        self.app.update_status("Advanced Tracker: Running parameter sweep...")
+        threading.Thread(target=self.sweep_worker, args=(initial_mass, rates, temperatures, pressures),
+                         daemon=True).start()
+        
+    def sweep_worker(self, initial_mass, rates, temperatures, pressures):
+        # Very large grids fan out to a process pool inside sweep_grid(); either way the Tk thread stays free
+        start = time.perf_counter()
+        try:
+            result = sweep_grid(initial_mass, self.transformation_options.keys(), rates, temperatures, pressures,
+                                options=self.transformation_options)
+        except Exception as e:
+            self.app.call_from_thread(self.sweep_finished, None, 0, e)
+        else:
+            self.app.call_from_thread(self.sweep_finished, result, time.perf_counter() - start, None)
+            
+    def sweep_finished(self, result, elapsed, error):
+        self.sweep_btn.config(state="normal")
+        if error is not None:
+            messagebox.showerror("Sweep Error", str(error))
+            self.app.update_status("Advanced Tracker: Parameter sweep failed.")
+            return
+        self.sweep_result = result
+        energy = self.sweep_result.energy
+        self.app.ui_updates.config(self.result_label, text=f"Sweep: {self.sweep_result.size:,} points in {elapsed:.2f} s | "
+                                                           f"Energy {energy.min():.2e} - {energy.max():.2e} J")
+        self.app.update_status("Advanced Tracker: Parameter sweep completed.")
+        file_path = filedialog.asksaveasfilename(defaultextension=".npz",
+                                                 filetypes=[("NumPy archive", "*.npz")],
+                                                 title="Save Sweep Results")
+        if file_path:
+            try:
+                self.sweep_result.save(file_path)
+                self.app.update_status(f"Advanced Tracker: Sweep saved to {file_path}")
+            except Exception as e:
+                messagebox.showerror("Export Error", str(e))
             
+    def run_monte_carlo(self):
+        spec = self.read_job_spec()
+        if spec is None:
+            return
+        try:
+            spread = float(self.mc_spread_entry.get()) / 100
+            samples = int(self.mc_runs_entry.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Enter a valid uncertainty (%) and number of runs.")
+            return
+        if spread < 0 or samples < 1:
+            messagebox.showerror("Input Error", "Uncertainty must not be negative and runs must be at least 1.")
+            return
+        self.mc_btn.config(state="disabled")
+        self.app.update_status(f"Advanced Tracker: Running {samples:,} Monte Carlo trajectories...")
+        threading.Thread(target=self.monte_carlo_worker, args=(spec, spread, samples), daemon=True).start()
+        
+    def monte_carlo_worker(self, spec, spread, samples):
+        # Each input is drawn as mean ± spread·mean; monte_carlo() moves large batches onto a process pool
+        try:
+            result = monte_carlo(spec["initial_mass"], spec["transformation"], samples,
+                                 rate=(spec["reaction_rate"], spread * spec["reaction_rate"]),
+                                 temperature=(spec["temperature"], spread * spec["temperature"]),
+                                 pressure=(spec["pressure"], spread * spec["pressure"]),
+                                 total_steps=spec["total_steps"], kinetics=spec["kinetics"],
+                                 options=self.transformation_options)
+        except Exception as e:
+            self.app.call_from_thread(self.monte_carlo_finished, spec, None, e)
+        else:
+            self.app.call_from_thread(self.monte_carlo_finished, spec, result, None)
+            
+    def monte_carlo_finished(self, spec, result, error):
+        self.mc_btn.config(state="normal")
+        if error is not None:
+            messagebox.showerror("Monte Carlo Error", str(error))
+            self.app.update_status("Advanced Tracker: Monte Carlo run failed.")
+            return
+        self.mc_result = result
+        self.show_monte_carlo(spec)
+        low, median, high = result.band(5)[-1], result.band(50)[-1], result.band(95)[-1]
+        self.app.ui_updates.config(self.result_label, text=f"Monte Carlo ({result.size:,} runs): Remaining Mass "
+                                                           f"{median:.2f} kg (90% band {low:.2f} - {high:.2f} kg)")
+        self.app.update_status("Advanced Tracker: Monte Carlo run completed.")
+        
+    def show_monte_carlo(self, spec):
+        # One band window is reused; closing it only hides it, so its themed widgets stay valid
+        if self.mc_window is None:
+            self.mc_window = tk.Toplevel(self.parent)
+            self.mc_window.title("Monte Carlo Percentile Bands")
+            self.mc_window.protocol("WM_DELETE_WINDOW", self.mc_window.withdraw)
+            self.mc_fig, self.mc_ax, self.mc_canvas = create_figure_canvas(self.mc_window, figsize=(6, 4))
+            self.app.theme.register_figure(self.mc_fig, self.mc_canvas)
+            self.app.theme.register_tree(self.mc_window)
+        result = self.mc_result
+        steps = result.steps
+        ax = self.mc_ax
+        ax.clear()
+        # Percentiles pair up from the outside in (5-95, 25-75); the middle one is drawn as the median line
+        count = len(result.percentiles)
+        for i in range(count // 2):
+            low, high = result.percentiles[i], result.percentiles[count - 1 - i]
+            ax.fill_between(steps, result.bands[i], result.bands[count - 1 - i], color="green",
+                            alpha=0.15 + 0.2 * i, linewidth=0, label=f"P{low}-P{high}")
+        if count % 2:
+            ax.plot(steps, result.bands[count // 2], color="darkgreen", label=f"P{result.percentiles[count // 2]}")
+        ax.set_title(f"{spec['transformation']} ({spec['kinetics']}): {result.size:,} runs")
+        ax.set_xlabel("Step")
+        ax.set_ylabel("Remaining Mass (kg)")
+        ax.legend(loc="upper right")
+        self.app.theme.apply(self.app.theme.current, widgets=[self.mc_window],
+                             figures=[(self.mc_fig, self.mc_canvas)])
+        self.mc_window.deiconify()
+        self.mc_window.lift()
+        
     def pause_simulation(self):
         if self.running:
             self.paused = True
@@ -192,6 +898,7 @@ class AdvancedMassConservationTrackerTab:
     def resume_simulation(self):
         if self.running and self.paused:
             self.paused = False
+            self.clock.resume()
             self.pause_btn.config(state="normal")
             self.resume_btn.config(state="disabled")
             self.app.update_status("Advanced Tracker: Simulation resumed.")
@@ -204,10 +911,9 @@ class AdvancedMassConservationTrackerTab:
         self.pause_btn.config(state="disabled")
         self.resume_btn.config(state="disabled")
         self.reset_btn.config(state="disabled")
-        self.result_label.config(text="Simulation reset.")
-        self.ax.clear()
-        self.canvas.draw()
-        self.progress['value'] = 0
+        self.app.ui_updates.config(self.result_label, text="Simulation reset.")
+        self.app.ui_updates.post(self.chart, self.chart.reset)
+        self.app.ui_updates.config(self.progress, value=0)
         self.app.update_status("Advanced Tracker: Simulation reset.")
 
 # ==================== Tab 3: Historical Simulation Mode ====================
@@ -215,7 +921,7 @@ class HistoricalSimulationTab:
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
-        self.sim_data = []
+        self.sim_data = SimulationLog()
         self.running = False
         self.step = 0
         self.total_steps = TOTAL_STEPS
@@ -233,11 +939,15 @@ class HistoricalSimulationTab:
         self.mass_entry.insert(0, "70")
         tk.Label(mass_frame, text="Transformation:", font=("Arial", 14)).grid(row=0, column=2, padx=5)
         self.transformation_var = tk.StringVar(value="Fusion")
-        options = {"Decay": 0.9, "Burn": 0.7, "Fusion": 0.5, "Explosion": 0.2}
+        options = dict(HISTORICAL_OPTIONS)
         self.transformation_options = options
         self.dropdown = ttk.Combobox(mass_frame, textvariable=self.transformation_var, 
                                      values=list(options.keys()), state="readonly", font=("Arial", 14), width=10)
         self.dropdown.grid(row=0, column=3, padx=5)
+        tk.Label(mass_frame, text="Steps:", font=("Arial", 14)).grid(row=0, column=4, padx=5)
+        self.steps_entry = tk.Entry(mass_frame, font=("Arial", 14), width=8)
+        self.steps_entry.grid(row=0, column=5, padx=5)
+        self.steps_entry.insert(0, str(TOTAL_STEPS))
         
         btn_frame = tk.Frame(parent)
         btn_frame.pack(pady=10)
@@ -245,56 +955,79 @@ class HistoricalSimulationTab:
         self.start_btn.grid(row=0, column=0, padx=5)
         self.stop_btn = tk.Button(btn_frame, text="Stop", font=("Arial", 14), command=self.stop_simulation, state="disabled")
         self.stop_btn.grid(row=0, column=1, padx=5)
+        tk.Label(btn_frame, text="Speed:", font=("Arial", 14)).grid(row=0, column=2, padx=5)
+        self.speed_var = tk.StringVar(value="1x")
+        ttk.Combobox(btn_frame, textvariable=self.speed_var, values=list(SPEED_OPTIONS), state="readonly",
+                     font=("Arial", 14), width=5).grid(row=0, column=3, padx=5)
+        self.clock = SimulationClock(step_interval=0.1)
         
         self.result_label = tk.Label(parent, text="", font=("Arial", 14))
         self.result_label.pack(pady=5)
         
-        self.fig, self.ax = plt.subplots(figsize=(6,4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
-        self.canvas.get_tk_widget().pack(pady=10)
+        self.fig, self.ax, self.canvas = create_figure_canvas(parent, figsize=(6,4))
+        self.ax.set_title("Historical Simulation: Remaining Mass Over Time")
+        self.ax.set_xlabel("Step")
+        self.ax.set_ylabel("Remaining Mass (kg)")
+        self.chart = LiveLineChart(self.ax, self.canvas, marker='o', color='green')
         
     def start_simulation(self):
         try:
             self.initial_mass = float(self.mass_entry.get())
+            self.total_steps = int(self.steps_entry.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Enter valid mass.")
+            messagebox.showerror("Input Error", "Enter valid mass and step count.")
+            return
+        if self.total_steps < 1:
+            messagebox.showerror("Input Error", "Steps must be at least 1.")
             return
         transformation = self.transformation_var.get()
         self.target_fraction = self.transformation_options[transformation]
         self.target_mass = self.initial_mass * self.target_fraction
-        self.delta = (self.initial_mass - self.target_mass) / self.total_steps
+        self.trajectory = RESULT_CACHE.trajectory(self.initial_mass, self.target_mass, self.total_steps)
         self.step = 0
-        self.sim_data = []
+        # Preallocated so the line artist can read the columns directly each step
+        self.sim_data = SimulationLog(self.total_steps + 1)
         self.running = True
+        self.app.show_live_run(self.sim_data)  # A new live run takes over the viewers again
+        if self.app.publisher is not None:
+            self.app.publisher.begin(self.sim_data, transformation=transformation, initial_mass=self.initial_mass,
+                                     target_mass=self.target_mass, total_steps=self.total_steps)
         self.start_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
+        self.chart.line.set_marker('o' if self.total_steps <= 1000 else 'None')  # Markers swamp long runs
+        low, high = sorted((self.initial_mass, self.target_mass))
+        pad = (high - low) * 0.05 or 1
+        self.chart.set_limits((-0.5, self.total_steps + 0.5), (low - pad, high + pad))
         self.app.update_status("Historical Simulation: Started.")
+        self.clock.start()
         self.animate()
         
+    @profiled("historical.animate")
     def animate(self):
         if not self.running:
             return
-        if self.step <= self.total_steps:
-            current_mass = self.initial_mass - self.delta * self.step
-            if current_mass < self.target_mass:
-                current_mass = self.target_mass
-            converted = self.initial_mass - current_mass
-            energy = converted * (C ** 2)
-            self.sim_data.append((self.step, current_mass, converted, energy))
-            self.ax.clear()
-            steps = [d[0] for d in self.sim_data]
-            remaining = [d[1] for d in self.sim_data]
-            self.ax.plot(steps, remaining, marker='o', color='green')
-            self.ax.set_title("Historical Simulation: Remaining Mass Over Time")
-            self.ax.set_xlabel("Step")
-            self.ax.set_ylabel("Remaining Mass (kg)")
-            self.canvas.draw()
-            self.result_label.config(text=f"Step {self.step}: Remaining Mass = {current_mass:.2f} kg")
-            self.step += 1
+        self.clock.speed = SPEED_OPTIONS[self.speed_var.get()]
+        due = self.clock.due_steps()
+        if due:
+            end = min(self.step + due, self.total_steps + 1)
+            steps_col, remaining_col, converted_col, energy_col = self.trajectory
+            self.sim_data.extend(steps_col[self.step:end], remaining_col[self.step:end],
+                                 converted_col[self.step:end], energy_col[self.step:end])
+            self.app.data.appended()
+            if self.app.publisher is not None:
+                self.app.publisher.publish()
+            current_mass = float(remaining_col[end - 1])
+            self.app.ui_updates.post(self.chart, self.chart.update,
+                                     self.sim_data.column("step"), self.sim_data.column("remaining"))
+            self.app.ui_updates.config(self.result_label, text=f"Step {end - 1}: Remaining Mass = {current_mass:.2f} kg")
+            self.step = end
             self.app.update_status(f"Historical Simulation: Step {self.step}/{self.total_steps}")
-            self.parent.after(100, self.animate)
+        if self.step <= self.total_steps:
+            self.parent.after(FRAME_INTERVAL_MS, self.animate)
         else:
             self.running = False
+            if self.app.publisher is not None:
+                self.app.publisher.end("completed")
             self.start_btn.config(state="normal")
             self.stop_btn.config(state="disabled")
             self.app.update_status("Historical Simulation: Completed.")
@@ -302,6 +1035,8 @@ class HistoricalSimulationTab:
             
     def stop_simulation(self):
         self.running = False
+        if self.app.publisher is not None:
+            self.app.publisher.end("stopped")
         self.start_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
         self.app.update_status("Historical Simulation: Stopped.")
@@ -314,16 +1049,13 @@ class DataLoggingTab:
         self.app = app
         tk.Label(parent, text="Data Logging", font=("Arial", 16, "bold")).pack(pady=10)
         
-        self.tree = ttk.Treeview(parent, columns=("Step", "Remaining Mass", "Converted Mass", "Energy"), show="headings")
-        self.tree.heading("Step", text="Step")
-        self.tree.heading("Remaining Mass", text="Remaining Mass (kg)")
-        self.tree.heading("Converted Mass", text="Converted Mass (kg)")
-        self.tree.heading("Energy", text="Energy (Joules)")
-        self.tree.column("Step", width=50)
-        self.tree.column("Remaining Mass", width=150)
-        self.tree.column("Converted Mass", width=150)
-        self.tree.column("Energy", width=200)
-        self.tree.pack(pady=10, fill='both', expand=True)
+        self.table = VirtualTable(parent, [("Step", "Step", 50),
+                                           ("Remaining Mass", "Remaining Mass (kg)", 150),
+                                           ("Converted Mass", "Converted Mass (kg)", 150),
+                                           ("Energy", "Energy (Joules)", 200)],
+                                  formatter=format_log_row)
+        self.tree = self.table.tree
+        self.table.frame.pack(pady=10, fill='both', expand=True)
         
         btn_frame = tk.Frame(parent)
         btn_frame.pack(pady=10)
@@ -333,55 +1065,84 @@ class DataLoggingTab:
         self.export_csv_btn.grid(row=0, column=1, padx=5)
         self.export_json_btn = tk.Button(btn_frame, text="Export JSON", font=("Arial", 14), command=self.export_json)
         self.export_json_btn.grid(row=0, column=2, padx=5)
+        self.export_npy_btn = tk.Button(btn_frame, text="Export Binary", font=("Arial", 14), command=self.export_npy)
+        self.export_npy_btn.grid(row=0, column=3, padx=5)
+        self.export_progress = ttk.Progressbar(parent, orient="horizontal", mode="determinate", length=400)
+        self.export_progress.pack(pady=5)
+        self.version = None  # Data plane version the table last showed
+        app.data.subscribe(self.on_data_changed)
+        
+    def on_data_changed(self, data):
+        self.app.ui_updates.post(self.table, self.sync)
         
+    def sync(self):
+        # Appended rows only move the scrollbar (or the viewport, if it follows the tail); a new run resets
+        reset, start, stop = self.app.data.changes(self.version)
+        self.version = self.app.data.version
+        if reset:
+            self.table.set_source(self.data_getter())
+        elif stop > start:
+            self.table.refresh()
+        
+    @profiled("data_logging.populate_data")
     def populate_data(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         data = self.data_getter()
         if data:
-            for row in data:
-                self.tree.insert("", "end", values=(row[0], f"{row[1]:.2f}", f"{row[2]:.2f}", f"{row[3]:.2e}"))
-            self.app.update_status("Data Logging: Data refreshed.")
+            self.table.set_source(data)
+            self.version = self.app.data.version
+            self.app.update_status(f"Data Logging: Data refreshed ({len(data)} rows).")
         else:
             messagebox.showinfo("Data Logging", "No simulation data available. Run Historical Simulation first.")
             
     def export_csv(self):
-        data = self.data_getter()
-        if not data:
-            messagebox.showinfo("Export", "No data available to export.")
-            return
-        file_path = filedialog.asksaveasfilename(defaultextension=".csv",
-                                                 filetypes=[("CSV files", "*.csv")],
-                                                 title="Save Simulation Data")
-        if file_path:
-            try:
-                with open(file_path, mode="w", newline="") as file:
-                    writer = csv.writer(file)
-                    writer.writerow(["Step", "Remaining Mass (kg)", "Converted Mass (kg)", "Energy (Joules)"])
-                    for row in data:
-                        writer.writerow(row)
-                messagebox.showinfo("Export", f"Data exported to {file_path}")
-                self.app.update_status("Data Logging: CSV exported successfully.")
-            except Exception as e:
-                messagebox.showerror("Export Error", str(e))
-                
+        self.start_export(export_csv, ".csv", [("CSV files", "*.csv")], "CSV")
+        
     def export_json(self):
+        self.start_export(export_json, ".json", [("JSON files", "*.json")], "JSON")
+        
+    def export_npy(self):
+        self.start_export(export_npy, ".npy", [("NumPy binary", "*.npy")], "Binary")
+        
+    def start_export(self, writer, extension, filetypes, label):
         data = self.data_getter()
         if not data:
             messagebox.showinfo("Export", "No data available to export.")
             return
-        file_path = filedialog.asksaveasfilename(defaultextension=".json",
-                                                 filetypes=[("JSON files", "*.json")],
+        file_path = filedialog.asksaveasfilename(defaultextension=extension,
+                                                 filetypes=filetypes,
                                                  title="Save Simulation Data")
-        if file_path:
-            try:
-                json_data = [{"Step": row[0], "Remaining Mass": row[1], "Converted Mass": row[2], "Energy": row[3]} for row in data]
-                with open(file_path, mode="w") as file:
-                    json.dump(json_data, file, indent=4)
-                messagebox.showinfo("Export", f"Data exported to {file_path}")
-                self.app.update_status("Data Logging: JSON exported successfully.")
-            except Exception as e:
-                messagebox.showerror("Export Error", str(e))
+        if not file_path:
+            return
+        self.set_export_buttons("disabled")
+        self.export_progress.config(maximum=len(data), value=0)
+        self.app.update_status(f"Data Logging: Exporting {label}...")
+        # Rows are streamed in chunks off the Tk thread; results come back through call_from_thread
+        threading.Thread(target=self.export_worker, args=(writer, data, file_path, label), daemon=True).start()
+        
+    def export_worker(self, writer, data, file_path, label):
+        try:
+            writer(data, file_path, progress=lambda done, total: self.app.call_from_thread(self.export_progressed, done))
+        except Exception as e:
+            self.app.call_from_thread(self.export_finished, file_path, label, e)
+        else:
+            self.app.call_from_thread(self.export_finished, file_path, label, None)
+            
+    def export_progressed(self, done):
+        self.app.ui_updates.config(self.export_progress, value=done)
+        
+    def export_finished(self, file_path, label, error):
+        self.set_export_buttons("normal")
+        if error is not None:
+            self.app.ui_updates.config(self.export_progress, value=0)
+            messagebox.showerror("Export Error", str(error))
+            return
+        messagebox.showinfo("Export", f"Data exported to {file_path}")
+        self.app.update_status(f"Data Logging: {label} exported successfully.")
+        
+    def set_export_buttons(self, state):
+        self.export_csv_btn.config(state=state)
+        self.export_json_btn.config(state=state)
+        self.export_npy_btn.config(state=state)
 
 # ==================== Tab 5: 3D Visualization ====================
 class Visualization3DTab:
@@ -389,41 +1150,147 @@ class Visualization3DTab:
         self.parent = parent
         self.data_getter = data_getter
         self.app = app
+        self.data = None
+        self.scatter = None
+        self.shown = np.arange(0)  # Row indices currently plotted
+        self.zoomed = False  # True while the x-limits show only part of the run; shown then covers just that part
+        self.version = None  # Data plane version the plot last showed
+        self.rendering = False
+        self.lod_pending = False
+        app.data.subscribe(self.on_data_changed)
         tk.Label(parent, text="3D Visualization", font=("Arial", 16, "bold")).pack(pady=10)
         self.refresh_btn = tk.Button(parent, text="Refresh 3D Plot", font=("Arial", 14), command=self.update_plot)
         self.refresh_btn.pack(pady=5)
         
-        self.fig = plt.Figure(figsize=(6,5), dpi=100)
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
-        self.canvas.get_tk_widget().pack(pady=10)
+        self.fig, self.ax, self.canvas = create_figure_canvas(parent, figsize=(6,5), projection='3d')
+        self.connect_zoom()
         
+    def connect_zoom(self):
+        # Zooming changes the visible step range, so the decimation is redone for it;
+        # ax.clear() replaces the callback registry, so this is repeated after every clear
+        self.ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+        
+    def point_budget(self):
+        # Roughly two points per horizontal pixel is as much detail as the screen can show
+        return max(500, 2 * self.canvas.get_tk_widget().winfo_width())
+        
+    @profiled("visualization3d.update_plot")
     def update_plot(self):
         data = self.data_getter()
         if not data:
             messagebox.showinfo("3D Visualization", "No historical data available. Run Historical Simulation first.")
             return
+        self.data = data
+        self.version = self.app.data.version
+        self.rendering = True
         self.ax.clear()
-        steps = [d[0] for d in data]
-        remaining = [d[1] for d in data]
-        energy = [d[3] for d in data]
-        energy_scaled = np.array(energy) / 1e16  # Scale energy for display
-        self.ax.scatter(steps, remaining, energy_scaled, c='purple', marker='o')
+        self.connect_zoom()
+        self.scatter = None
+        self.zoomed = False
+        self.ax.set_autoscale_on(True)
         self.ax.set_title("3D Scatter: Step vs Remaining Mass vs Energy")
         self.ax.set_xlabel("Step")
         self.ax.set_ylabel("Remaining Mass (kg)")
         self.ax.set_zlabel("Energy (scaled)")
+        self.app.theme.apply_figure(self.fig, THEMES[self.app.theme.current])  # ax.clear() resets title and labels
+        shown = self.render_lod(0, len(data))
+        self.ax.set_autoscale_on(False)  # Later LOD passes must not move the view
+        self.rendering = False
         self.canvas.draw()
-        self.app.update_status("3D Visualization: Plot refreshed.")
+        self.app.update_status(f"3D Visualization: Plot refreshed ({shown} of {len(data)} points shown).")
+        
+    def render_lod(self, start, stop):
+        self.shown = decimate_minmax(self.data.column("remaining"), self.point_budget(), start, stop)
+        self.draw_points(self.shown)
+        return len(self.shown)
+        
+    def draw_points(self, idx):
+        if self.scatter is not None:
+            self.scatter.remove()
+        self.scatter = draw_scatter_points(self.ax, self.data, idx)
+        
+    def on_data_changed(self, data):
+        self.app.ui_updates.post(self, self.sync)
+        
+    def sync(self):
+        if self.app.notebook.select() != str(self.parent):
+            return  # Hidden: caught up from the same version when the tab is shown again
+        reset, start, stop = self.app.data.changes(self.version)
+        if reset or self.data is None:
+            if stop:
+                self.update_plot()
+            return
+        if stop > start:
+            self.append_points(start, stop)
+            
+    def append_points(self, start, stop):
+        # Only the new rows are decimated, with a share of the point budget matching their share of the rows in
+        # view; once the plotted points exceed twice the budget the rows in view are decimated again.
+        # Zoomed in, the user's limits are kept and only new rows inside them are added
+        self.version = self.app.data.version
+        budget = self.point_budget()
+        remaining = self.data.column("remaining")
+        low, high = (self.visible_rows() if self.zoomed else (0, stop))
+        new_start, new_stop = max(start, low), min(stop, high)
+        if new_stop <= new_start:
+            return  # Nothing new inside the zoomed view
+        idx = decimate_minmax(remaining, max(2, budget * (new_stop - new_start) // (high - low)), new_start, new_stop)
+        self.shown = np.concatenate((self.shown, idx))
+        if len(self.shown) > 2 * budget:
+            self.shown = decimate_minmax(remaining, budget, low, high)
+        self.rendering = True
+        if not self.zoomed:
+            for (lo, hi), values, setter in ((self.ax.get_xlim(), self.data.column("step")[idx], self.ax.set_xlim),
+                                             (self.ax.get_ylim(), remaining[idx], self.ax.set_ylim),
+                                             (self.ax.get_zlim(), self.data.column("energy")[idx] / 1e16,
+                                              self.ax.set_zlim)):
+                setter(min(lo, values.min()), max(hi, values.max()))
+        self.draw_points(self.shown)
+        self.rendering = False
+        self.canvas.draw_idle()
+        
+    def visible_rows(self):
+        # Row range covering the current x-limits, padded by a row either side so edge points are not dropped
+        start, stop = np.searchsorted(self.data.column("step"), self.ax.get_xlim(), side="left")
+        return max(start - 1, 0), min(stop + 1, len(self.data))
+        
+    def on_xlim_changed(self, ax):
+        if self.rendering or self.lod_pending or not self.data:
+            return
+        self.lod_pending = True
+        self.parent.after_idle(self.refresh_lod)  # Coalesce the burst of events one zoom gesture fires
+        
+    def refresh_lod(self):
+        self.lod_pending = False
+        start, stop = self.visible_rows()
+        self.zoomed = start > 0 or stop < len(self.data)
+        self.rendering = True
+        self.render_lod(start, stop)
+        self.rendering = False
+        self.canvas.draw_idle()
 
 # ==================== Tab 6: Network Simulation ====================
 class NetworkSimulationTab:
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
+        self.session = None
+        self.upload_source = None
+        self.upload_url = None
+        self.upload_offset = 0  # Rows of upload_source already accepted by upload_url
+        # Requests run on worker threads; results come back through app.call_from_thread
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="zahoor-network")
+        self.cancel = threading.Event()  # Set on shutdown so a running upload stops between batches
         tk.Label(parent, text="Multi-user Network Simulation & Internet Integration", 
                  font=("Arial", 16, "bold")).pack(pady=20)
         
+        endpoint_frame = tk.Frame(parent)
+        endpoint_frame.pack(pady=5)
+        tk.Label(endpoint_frame, text="Server URL:", font=("Arial", 14)).grid(row=0, column=0, padx=5)
+        self.endpoint_entry = tk.Entry(endpoint_frame, font=("Arial", 14), width=40)
+        self.endpoint_entry.grid(row=0, column=1, padx=5)
+        self.endpoint_entry.insert(0, DEFAULT_ENDPOINT)
+        
         self.connect_btn = tk.Button(parent, text="Check Internet Connection", font=("Arial", 14), command=self.check_connection)
         self.connect_btn.pack(pady=10)
         
@@ -433,38 +1300,102 @@ class NetworkSimulationTab:
         self.response_text = tk.Text(parent, height=10, font=("Arial", 12))
         self.response_text.pack(pady=10, padx=10, fill="both", expand=True)
         
-    def check_connection(self):
+    def get_session(self):
+        # One keep-alive session is reused for every request from this tab
+        if self.session is None:
+            import requests  # Deferred: only needed once the user goes online
+            self.session = requests.Session()
+        return self.session
+        
+    def endpoint_url(self, path):
+        return self.endpoint_entry.get().strip().rstrip("/") + path
+        
+    def run_in_background(self, request, on_done):
+        self.set_buttons("disabled")
+        future = self.executor.submit(request)
+        future.add_done_callback(lambda f: self.app.call_from_thread(on_done, f))
+        
+    def set_buttons(self, state):
+        self.connect_btn.config(state=state)
+        self.send_data_btn.config(state=state)
+        
+    def show_response(self, future, success_text, failure_text, success_status, failure_status, error_status):
+        self.set_buttons("normal")
+        self.response_text.delete("1.0", tk.END)
         try:
-            response = requests.get("https://httpbin.org/get", timeout=5)
-            self.response_text.delete("1.0", tk.END)
-            if response.status_code == 200:
-                self.response_text.insert(tk.END, "Internet Connection Successful!\n")
-                self.response_text.insert(tk.END, response.text)
-                self.app.update_status("Internet Connection: Successful.")
-            else:
-                self.response_text.insert(tk.END, "Internet Connection Failed!")
-                self.app.update_status("Internet Connection: Failed.")
+            response = future.result()
         except Exception as e:
-            self.response_text.delete("1.0", tk.END)
             self.response_text.insert(tk.END, f"Error: {e}")
-            self.app.update_status("Internet Connection: Error encountered.")
+            self.app.update_status(error_status)
+            return
+        if response.status_code == 200:
+            self.response_text.insert(tk.END, success_text + "\n")
+            self.response_text.insert(tk.END, response.text)
+            self.app.update_status(success_status)
+        else:
+            self.response_text.insert(tk.END, failure_text)
+            self.app.update_status(failure_status)
+        
+    def check_connection(self):
+        session = self.get_session()
+        url = self.endpoint_url("/get")
+        self.app.update_status("Internet Connection: Checking...")
+        self.run_in_background(lambda: session.get(url, timeout=5),
+                               lambda f: self.show_response(f, "Internet Connection Successful!",
+                                                            "Internet Connection Failed!",
+                                                            "Internet Connection: Successful.",
+                                                            "Internet Connection: Failed.",
+                                                            "Internet Connection: Error encountered."))
             
     def send_data(self):
-        data = {"simulation": "The Eternal Zahoor Simulator", "status": "Test data"}
+        data = self.app.get_historical_data()
+        if not data:
+            messagebox.showinfo("Upload", "No simulation data available. Run Historical Simulation first.")
+            return
+        url = self.endpoint_url("/post")
+        if data is not self.upload_source or url != self.upload_url:
+            self.upload_source = data
+            self.upload_url = url
+            self.upload_offset = 0
+        if self.upload_offset >= len(data):
+            self.app.update_status(f"All {len(data)} rows already uploaded.")
+            return
+        session = self.get_session()
+        start = self.upload_offset
+        self.app.update_status(f"Uploading simulation data from row {start}...")
+        progress = lambda done, total: self.app.call_from_thread(self.upload_progressed, done, total)
+        self.run_in_background(lambda: upload_log(session, url, data, start=start, progress=progress,
+                                                  cancel=self.cancel),
+                               self.upload_finished)
+        
+    def upload_progressed(self, done, total):
+        self.upload_offset = done
+        self.app.update_status(f"Uploading simulation data: {done}/{total} rows")
+        
+    def upload_finished(self, future):
+        self.set_buttons("normal")
+        self.response_text.delete("1.0", tk.END)
         try:
-            response = requests.post("https://httpbin.org/post", json=data, timeout=5)
-            self.response_text.delete("1.0", tk.END)
-            if response.status_code == 200:
-                self.response_text.insert(tk.END, "Data sent successfully!\n")
-                self.response_text.insert(tk.END, response.text)
-                self.app.update_status("Data sent to server successfully.")
-            else:
-                self.response_text.insert(tk.END, "Failed to send data!")
-                self.app.update_status("Failed to send data to server.")
+            bytes_sent = future.result()
+        except UploadInterrupted as e:
+            self.upload_offset = e.offset
+            self.send_data_btn.config(text="Resume Upload")
+            self.response_text.insert(tk.END, f"Error: {e}\nClick Resume Upload to continue from row {e.offset}.")
+            self.app.update_status("Error sending data to server.")
+            return
         except Exception as e:
-            self.response_text.delete("1.0", tk.END)
             self.response_text.insert(tk.END, f"Error: {e}")
             self.app.update_status("Error sending data to server.")
+            return
+        self.send_data_btn.config(text="Send Simulation Data")
+        self.response_text.insert(tk.END, f"Data sent successfully!\n{self.upload_offset} rows uploaded "
+                                          f"({bytes_sent / 1024:.1f} KiB compressed).")
+        self.app.update_status("Data sent to server successfully.")
+        
+    def shutdown(self):
+        # Executor threads are joined at interpreter exit, so pending work must stop rather than run to completion
+        self.cancel.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 # ==================== Tab 7: Tutorial ====================
 class TutorialTab:
@@ -479,15 +1410,23 @@ class TutorialTab:
             "1. Mass-Energy Conversion: Enter a mass to compute its energy equivalent.\n"
             "2. Advanced Mass Tracker: Run interactive simulations with parameters like reaction rate, temperature, and pressure.\n"
             "   - Use the 'Nuclear Fusion' option for an alternate model.\n"
+            "   - Run Monte Carlo samples rate, temperature and pressure (± the uncertainty) and plots percentile bands.\n"
+            "   - Kinetics picks the rate model: Linear, Exponential decay, Arrhenius (temperature-driven) or a multi-stage chain.\n"
             "3. Historical Simulation: View a timeline of mass conversion steps.\n"
+            "   - Both simulations have a Speed control; 'Max' runs as fast as possible.\n"
             "4. Data Logging: Refresh and export simulation data as CSV or JSON.\n"
             "5. 3D Visualization: Explore simulation data in an interactive 3D scatter plot.\n"
             "6. Network Simulation: Check internet connectivity and send simulation data.\n"
             "7. Tutorial: You're here! Read instructions and app usage details.\n\n"
             "Menu Options:\n"
+            "   - File > Import Run: Load a run saved with Export Binary into Data Logging and 3D Visualization.\n"
             "   - File > Exit: Close the app.\n"
             "   - Help > About: App information.\n"
-            "   - Theme > Toggle Dark Mode: Switch between light and dark themes.\n\n"
+            "   - Theme > Toggle Dark Mode: Switch between light and dark themes.\n"
+            "   - Tools > Toggle Profiler Overlay / Dump Profile: Frame timings and memory use for diagnosing stalls.\n"
+            "   - Tools > Toggle Shared Data Buffer: Mirror the current run into shared memory for other processes.\n"
+            "   - Tools > Toggle Live Stream: Publish Historical Simulation steps as they run; watch them with\n"
+            "     'python zahoor_engine.py subscribe'.\n\n"
             "Enjoy exploring the simulation and learning about mass-energy conversion!"
         )
         self.text_area = tk.Text(parent, wrap="word", font=("Arial", 12), height=20)
@@ -499,6 +1438,13 @@ class TutorialTab:
 class ZahoorApp:
     def __init__(self, root):
         self.root = root
+        self.data = DataPlane()  # The run shown by Data Logging and 3D Visualization
+        self.imported_run = False
+        self.shared_buffer = None
+        self.shared_warned_epoch = None  # Run whose truncation in the shared buffer was already reported
+        self.ui_updates = UiUpdateQueue(root)
+        self.profiler_overlay = ProfilerOverlay(root, PROFILER)
+        self.publisher = None
         root.title("The Eternal Zahoor Simulator - Advanced App")
         root.geometry("1300x950")
         self.create_menu()
@@ -522,24 +1468,38 @@ class ZahoorApp:
         self.notebook.add(self.tab6, text="Network Simulation")
         self.notebook.add(self.tab7, text="Tutorial")
         
-        self.mass_energy_tab = MassEnergyConversionTab(self.tab1, self)
-        self.advanced_tracker_tab = AdvancedMassConservationTrackerTab(self.tab2, self)
-        self.historical_tab = HistoricalSimulationTab(self.tab3, self)
-        self.data_logging_tab = DataLoggingTab(self.tab4, self.get_historical_data, self)
-        self.visualization3d_tab = Visualization3DTab(self.tab5, self.get_historical_data, self)
-        self.network_tab = NetworkSimulationTab(self.tab6, self)
-        self.tutorial_tab = TutorialTab(self.tab7, self)
+        # Tabs (and their figures) are only built the first time they are selected
+        self.tab_factories = {
+            "mass_energy_tab": (self.tab1, lambda: MassEnergyConversionTab(self.tab1, self)),
+            "advanced_tracker_tab": (self.tab2, lambda: AdvancedMassConservationTrackerTab(self.tab2, self)),
+            "historical_tab": (self.tab3, lambda: HistoricalSimulationTab(self.tab3, self)),
+            "data_logging_tab": (self.tab4, lambda: DataLoggingTab(self.tab4, self.get_historical_data, self)),
+            "visualization3d_tab": (self.tab5, lambda: Visualization3DTab(self.tab5, self.get_historical_data, self)),
+            "network_tab": (self.tab6, lambda: NetworkSimulationTab(self.tab6, self)),
+            "tutorial_tab": (self.tab7, lambda: TutorialTab(self.tab7, self)),
+        }
+        for name in self.tab_factories:
+            setattr(self, name, None)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        root.after_idle(self.on_tab_changed)  # Let the window appear before the first tab is built
         
         self.status_var = tk.StringVar()
         self.status_var.set("Welcome to The Eternal Zahoor Simulator!")
         self.status_bar = tk.Label(root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor='w', font=("Arial", 10))
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
+        # Worker threads never touch Tk directly; they queue callbacks for the main loop
+        self.main_queue = queue.Queue()
+        self.drain_main_queue()
+        self.theme = ThemeManager(root)
+        self.theme.register_tree(root)
         self.apply_theme()
         
     def create_menu(self):
         menubar = tk.Menu(self.root)
         file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Import Run...", command=self.import_run)
+        file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         menubar.add_cascade(label="File", menu=file_menu)
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -548,16 +1508,145 @@ class ZahoorApp:
         theme_menu = tk.Menu(menubar, tearoff=0)
         theme_menu.add_command(label="Toggle Dark Mode", command=self.toggle_dark_mode)
         menubar.add_cascade(label="Theme", menu=theme_menu)
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        tools_menu.add_command(label="Toggle Profiler Overlay", command=self.toggle_profiler_overlay)
+        tools_menu.add_command(label="Dump Profile...", command=self.dump_profile)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Toggle Live Stream", command=self.toggle_live_stream)
+        tools_menu.add_command(label="Toggle Shared Data Buffer", command=self.toggle_shared_buffer)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
         self.root.config(menu=menubar)
         
     def show_about(self):
         messagebox.showinfo("About", "The Eternal Zahoor Simulator\nVersion 2.0\nAdvanced multi-functional simulation app.\nDeveloped with Python and Tkinter.")
         
+    def toggle_profiler_overlay(self):
+        self.profiler_overlay.toggle()
+        
+    def toggle_live_stream(self):
+        if self.publisher is not None:
+            self.publisher.close()
+            self.publisher = None
+            self.update_status("Live stream stopped.")
+            return
+        try:
+            self.publisher = StepPublisher(port=LIVE_STREAM_PORT)
+        except OSError as e:
+            messagebox.showerror("Live Stream", f"Could not listen on port {LIVE_STREAM_PORT}: {e}")
+            return
+        host, port = self.publisher.address[:2]
+        self.update_status(f"Live stream on {host}:{port}; Historical Simulation runs are published as they play.")
+        
+    def toggle_shared_buffer(self):
+        if self.shared_buffer is not None:
+            self.data.unsubscribe(self.check_shared_buffer)
+            self.shared_buffer.close()
+            self.shared_buffer = None
+            self.update_status("Shared data buffer closed.")
+            return
+        try:
+            self.shared_buffer = SharedLogMirror(self.data, name=SHARED_BUFFER_NAME)
+        except OSError as e:
+            messagebox.showerror("Shared Data Buffer", f"Could not create shared memory {SHARED_BUFFER_NAME!r}: {e}")
+            return
+        self.update_status(f"Shared data buffer '{self.shared_buffer.name}' is mirroring the current run.")
+        self.shared_warned_epoch = None
+        self.data.subscribe(self.check_shared_buffer)
+        self.check_shared_buffer(self.data)
+        
+    def check_shared_buffer(self, data):
+        if self.shared_buffer.truncated and self.shared_warned_epoch != data.epoch:
+            self.shared_warned_epoch = data.epoch
+            self.update_status(f"Shared data buffer is full: only the first {self.shared_buffer.capacity:,} rows "
+                               f"of this run are mirrored.")
+        
+    def dump_profile(self):
+        if not PROFILER.samples:
+            messagebox.showinfo("Profiler", "No samples recorded yet. Turn on the profiler overlay (or set ZAHOOR_PROFILE=1) first.")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".json",
+                                                 filetypes=[("JSON files", "*.json")],
+                                                 title="Save Profile")
+        if file_path:
+            try:
+                PROFILER.sample_memory()
+                PROFILER.dump(file_path)
+                self.update_status(f"Profile written to {file_path}")
+            except Exception as e:
+                messagebox.showerror("Profiler", str(e))
+        
     def update_status(self, msg):
-        self.status_var.set(msg)
+        self.ui_updates.set_var(self.status_var, msg)
+        
+    def run_jobs(self, specs, on_done):
+        # The process pool is driven from a helper thread so the Tk loop keeps running
+        def worker():
+            progress = lambda done, total, spec: self.call_from_thread(
+                self.update_status, f"Jobs: {done}/{total} finished (last: {spec.get('transformation', '?')})")
+            try:
+                results = JobRunner().run(specs, progress=progress)
+            except Exception as e:
+                results = [e] * len(specs)
+            self.call_from_thread(on_done, specs, results)
+        self.update_status(f"Jobs: running {len(specs)} simulations...")
+        threading.Thread(target=worker, daemon=True).start()
+        
+    def call_from_thread(self, func, *args):
+        self.main_queue.put((func, args))
+        
+    def drain_main_queue(self):
+        self.root.after(30, self.drain_main_queue)  # Reschedule first so a failing callback can't stop the loop
+        while True:
+            try:
+                func, args = self.main_queue.get_nowait()
+            except queue.Empty:
+                break
+            func(*args)
+        
+    def on_tab_changed(self, event=None):
+        selected = self.notebook.select()
+        for name, (frame, _) in self.tab_factories.items():
+            if str(frame) == selected:
+                tab = self.get_tab(name)
+                if hasattr(tab, "sync"):
+                    tab.sync()  # Viewers catch up with changes made while they were hidden
+                
+    def get_tab(self, name):
+        if getattr(self, name) is None:
+            frame, factory = self.tab_factories[name]
+            tab = factory()
+            setattr(self, name, tab)
+            # Only the new tab's widgets and figure need theming
+            figures = [(tab.fig, tab.canvas)] if hasattr(tab, "fig") else []
+            for fig, canvas in figures:
+                self.theme.register_figure(fig, canvas)
+            self.theme.apply(self.theme.current, widgets=self.theme.register_tree(frame), figures=figures)
+        return getattr(self, name)
         
     def get_historical_data(self):
-        return self.historical_tab.sim_data
+        return self.data.log
+        
+    def import_run(self):
+        file_path = filedialog.askopenfilename(filetypes=[("NumPy binary", "*.npy")], title="Import Simulation Run")
+        if not file_path:
+            return
+        try:
+            # Memory-mapped: rows are only paged in as the viewers touch them
+            log = load_npy(file_path)
+        except Exception as e:
+            messagebox.showerror("Import Error", str(e))
+            return
+        self.get_tab("data_logging_tab")
+        self.get_tab("visualization3d_tab")
+        self.imported_run = True
+        self.data.replace(log)
+        self.update_status(f"Imported {len(log)} rows from {file_path}")
+        
+    def show_live_run(self, log):
+        if self.imported_run:
+            self.imported_run = False
+            self.update_status("Imported run closed; showing live Historical Simulation data.")
+        self.data.replace(log)
         
     def toggle_dark_mode(self):
         global DARK_MODE
@@ -567,26 +1656,22 @@ class ZahoorApp:
         self.update_status(f"Theme switched to {mode} Mode.")
         
     def apply_theme(self):
-        bg_color = "#2e2e2e" if DARK_MODE else "#f0f0f0"
-        fg_color = "#ffffff" if DARK_MODE else "#000000" x
-        widget_bg = bg_color
-        widget_fg = fg_color
-        
-        self.root.config(bg=bg_color)
-        self.status_bar.config(bg=bg_color, fg=fg_color)
-        for widget in self.root.winfo_children():
-            if isinstance(widget, (tk.Frame, ttk.Frame, tk.Label, tk.Button, tk.Entry, tk.Text)):
-                try:
-                    widget.config(bg=widget_bg, fg=widget_fg)
-                except:
-                    pass
-        if hasattr(self, 'tutorial_tab'):
-            self.tutorial_tab.text_area.config(bg=bg_color, fg=fg_color, insertbackground=fg_color)
+        self.theme.apply("dark" if DARK_MODE else "light")
+        
+    def shutdown(self):
+        if self.network_tab is not None:
+            self.network_tab.shutdown()
+        # The shared memory block would otherwise outlive the app and block the next Toggle Shared Data Buffer
+        if self.shared_buffer is not None:
+            self.shared_buffer.close()
+        if self.publisher is not None:
+            self.publisher.close()
 
 def main():
     root = tk.Tk()
     app = ZahoorApp(root)
     root.mainloop()
+    app.shutdown()
 
 if __name__ == "__main__":
     main()
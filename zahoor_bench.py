@@ -0,0 +1,163 @@
+"""Benchmarks for the Zahoor simulator's simulation, rendering, table and export paths (headless, Agg)."""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from zahoor_engine import (SimulationLog, decimate_minmax, export_csv, export_json, export_npy, load_npy,
+                           simulate_trajectory)
+from zahoorApp import LiveBarChart, LiveLineChart, draw_scatter_points, format_log_row
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+TABLE_PAGE_ROWS = 25
+POINT_BUDGET = 2000
+
+def best_of(func, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def agg_axes(projection=None):
+    fig = Figure(figsize=(6, 4), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    return fig.add_subplot(111, projection=projection), canvas
+
+def bench_simulation(n, results):
+    seconds = best_of(lambda: simulate_trajectory(70.0, 35.0, n))
+    results.append(("simulate_trajectory", n, "steps_per_s", (n + 1) / seconds))
+    columns = simulate_trajectory(70.0, 35.0, n)
+    rows = min(n + 1, 100_000)  # Per-step appends are slow by nature; cap the work, the rate is what matters
+
+    def append_steps():
+        log = SimulationLog(rows)
+        for i in range(rows):
+            log.append(i, columns[1][i], columns[2][i], columns[3][i])
+
+    results.append(("log_append", n, "steps_per_s", rows / best_of(append_steps)))
+
+    def extend_batches():
+        log = SimulationLog(n + 1)
+        for start in range(0, n + 1, 10_000):  # One clock tick's worth of steps at "Max" speed
+            stop = start + 10_000
+            log.extend(columns[0][start:stop], columns[1][start:stop], columns[2][start:stop], columns[3][start:stop])
+
+    results.append(("log_extend", n, "steps_per_s", (n + 1) / best_of(extend_batches)))
+
+def bench_rendering(n, log, results, frames=50):
+    ax, canvas = agg_axes()
+    chart = LiveBarChart(ax, canvas, ["Initial", "Remaining", "Converted"], ["blue", "green", "red"])
+    chart.fit_limits([70.0, 35.0])
+    chart.blitter.full_redraw()
+    remaining = log.column("remaining")
+
+    def bar_frames():
+        for i in range(frames):
+            value = float(remaining[i * len(remaining) // frames])
+            chart.update([70.0, value, 70.0 - value], title=f"Step {i}")
+
+    results.append(("bar_chart_frame", n, "ms", best_of(bar_frames) / frames * 1000))
+
+    ax, canvas = agg_axes()
+    line = LiveLineChart(ax, canvas, color="green")
+    line.set_limits((0, n), (30, 75))
+    steps = log.column("step")
+    seconds = best_of(lambda: [line.update(steps, remaining) for _ in range(5)]) / 5
+    results.append(("line_chart_frame", n, "ms", seconds * 1000))
+
+    ax, canvas = agg_axes(projection="3d")
+
+    def scatter_3d():
+        ax.clear()
+        idx = decimate_minmax(remaining, POINT_BUDGET)
+        draw_scatter_points(ax, log, idx)
+        canvas.draw()
+
+    results.append(("update_plot_3d", n, "ms", best_of(scatter_3d) * 1000))
+
+def bench_table(n, log, results):
+    results.append(("table_page", n, "ms", best_of(
+        lambda: [format_log_row(row) for row in log.rows(n // 2, n // 2 + TABLE_PAGE_ROWS)]) * 1000))
+    if n <= 100_000:  # The pre-virtualization cost of formatting every row, for comparison
+        results.append(("table_all_rows", n, "ms", best_of(lambda: [format_log_row(row) for row in log], 1) * 1000))
+
+def bench_exports(n, log, results, directory):
+    for name, writer, extension in (("export_csv", export_csv, ".csv"), ("export_json", export_json, ".json"),
+                                    ("export_npy", export_npy, ".npy")):
+        path = os.path.join(directory, f"bench_{n}{extension}")
+        seconds = best_of(lambda: writer(log, path), 1)
+        results.append((name, n, "rows_per_s", len(log) / seconds))
+        results.append((name, n, "mb_per_s", os.path.getsize(path) / 2**20 / seconds))
+    path = os.path.join(directory, f"bench_{n}.npy")
+    results.append(("load_npy", n, "ms", best_of(lambda: load_npy(path)) * 1000))
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(sizes):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            print(f"benchmarking {n} steps...", file=sys.stderr)
+            log = SimulationLog.from_columns(*simulate_trajectory(70.0, 35.0, n))
+            bench_simulation(n, results)
+            bench_rendering(n, log, results)
+            bench_table(n, log, results)
+            bench_exports(n, log, results, directory)
+    return {
+        "meta": {"commit": git_commit(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                 "python": platform.python_version(), "numpy": np.__version__,
+                 "matplotlib": matplotlib.__version__, "platform": platform.platform()},
+        "results": [{"name": name, "size": size, "metric": metric, "value": value}
+                    for name, size, metric, value in results],
+    }
+
+def compare(report, baseline):
+    # Ratio > 1 means the current run is better; "ms" metrics are lower-is-better, rates higher-is-better
+    previous = {(row["name"], row["size"], row["metric"]): row["value"] for row in baseline["results"]}
+    print(f"compared with {baseline['meta'].get('commit') or 'baseline'}:", file=sys.stderr)
+    for row in report["results"]:
+        old = previous.get((row["name"], row["size"], row["metric"]))
+        if not old or not row["value"]:
+            continue
+        ratio = old / row["value"] if row["metric"] == "ms" else row["value"] / old
+        print(f"{row['name']:<22} {row['size']:>9} {row['metric']:<12} {ratio:>8.2f}x", file=sys.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Zahoor simulator (headless).")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Steps per run.")
+    parser.add_argument("-o", "--output", help="Write results as JSON to this file (default: stdout).")
+    parser.add_argument("--compare", metavar="BASELINE", help="Print speedups relative to an earlier results file.")
+    args = parser.parse_args(argv)
+    report = run(args.sizes)
+    for row in report["results"]:
+        print(f"{row['name']:<22} {row['size']:>9} {row['metric']:<12} {row['value']:>14.3f}", file=sys.stderr)
+    if args.compare:
+        with open(args.compare) as file:
+            compare(report, json.load(file))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1124 @@
+"""Headless simulation core for The Eternal Zahoor Simulator (no Tk required)."""
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import os
+import queue
+import socket
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+# Global constant and simulation steps
+C = 3e8  # Speed of light (m/s)
+TOTAL_STEPS = 100
+
+TRANSFORMATION_OPTIONS = {"Decay": 0.9, "Burn": 0.7, "Fusion": 0.5, "Explosion": 0.2, "Nuclear Fusion": 0.3}
+HISTORICAL_OPTIONS = {"Decay": 0.9, "Burn": 0.7, "Fusion": 0.5, "Explosion": 0.2}
+
+# ==================== Physics ====================
+def mass_to_energy(mass):
+    return mass * (C ** 2)
+
+def effective_fraction(transformation, base_fraction, reaction_rate=100.0, temperature=300.0, pressure=1.0):
+    """Fraction of the initial mass left once the transformation completes."""
+    if transformation == "Nuclear Fusion":
+        return 0.3 * (reaction_rate / 100)
+    fraction = base_fraction * (reaction_rate / 100) * (temperature / 300) * (pressure / 1)
+    return min(fraction, 1)
+
+def simulate_trajectory(initial_mass, target_mass, total_steps=TOTAL_STEPS, kinetics="Linear", temperature=300.0):
+    """Return the (step, remaining, converted, energy) columns for a whole run at once."""
+    if total_steps < 1:
+        raise ValueError("Steps must be at least 1.")
+    steps = np.arange(total_steps + 1)
+    if kinetics == "Linear":
+        delta = (initial_mass - target_mass) / total_steps
+        remaining = np.maximum(initial_mass - delta * steps, target_mass)
+    else:
+        # The model shapes how the convertible mass approaches the target; its last species is the converted share
+        product = KINETICS[kinetics].integrate(total_steps, temperature)[:, -1]
+        remaining = initial_mass - (initial_mass - target_mass) * product
+    converted = initial_mass - remaining
+    energy = mass_to_energy(converted)
+    return steps, remaining, converted, energy
+
+# ==================== Kinetics ====================
+GAS_CONSTANT = 8.314  # J/(mol K)
+REFERENCE_TEMPERATURE = 300.0  # K at which a stage runs at its nominal rate
+
+def expm(a):
+    """Matrix exponential of a (stack of) small square matrices by scaling and squaring."""
+    a = np.asarray(a, dtype=np.float64)
+    norm = np.abs(a).sum(axis=-2).max() if a.size else 0.0
+    squarings = max(0, int(np.ceil(np.log2(norm))) + 1) if norm > 0 else 0
+    a = a / 2.0 ** squarings  # Norm <= 1/2, where 18 Taylor terms are exact to double precision
+    result = np.broadcast_to(np.eye(a.shape[-1]), a.shape).copy()
+    term = result.copy()
+    for k in range(1, 18):
+        term = term @ a / k
+        result += term
+    for _ in range(squarings):
+        result = result @ result
+    return result
+
+def integrate_linear(rate_matrix, y0, dt, total_steps):
+    """Solve dy/dt = K y exactly at total_steps + 1 evenly spaced times; returns (steps + 1, ..., species)."""
+    # K may carry leading batch axes (one system per trajectory), matched by y0's leading axes
+    rate_matrix = np.asarray(rate_matrix, dtype=np.float64)
+    y0 = np.asarray(y0, dtype=np.float64)
+    out = np.empty((total_steps + 1,) + np.broadcast_shapes(y0.shape, rate_matrix.shape[:-1]))
+    out[0] = y0
+    if total_steps == 0:
+        return out
+    propagator = expm(rate_matrix * dt)
+    block = min(total_steps, max(64, int(np.sqrt(total_steps))))
+    for n in range(1, block + 1):
+        out[n] = (propagator @ out[n - 1][..., None])[..., 0]
+    # Each later block is the previous block advanced by `block` steps: one batched matmul per block, not per step
+    jump = np.linalg.matrix_power(propagator, block)
+    for start in range(block + 1, total_steps + 1, block):
+        stop = min(start + block, total_steps + 1)
+        out[start:stop] = (jump @ out[start - block:stop - block][..., None])[..., 0]
+    return out
+
+class ReactionChain:
+    """First-order chain A -> B -> ... -> product; each stage has a rate (per run) and an activation energy."""
+    def __init__(self, stages):
+        self.stages = [(float(rate), float(activation_energy)) for rate, activation_energy in stages]
+
+    @property
+    def species(self):
+        return len(self.stages) + 1
+
+    @property
+    def temperature_dependent(self):
+        return any(activation_energy for _, activation_energy in self.stages)
+
+    def rate_constants(self, temperature=REFERENCE_TEMPERATURE):
+        # Arrhenius: k(T) = k_ref * exp(-Ea/R * (1/T - 1/T_ref)); stages with Ea = 0 ignore temperature
+        temperature = np.asarray(temperature, dtype=np.float64)[..., None]
+        rates = np.array([rate for rate, _ in self.stages])
+        activation = np.array([energy for _, energy in self.stages])
+        return rates * np.exp(-activation / GAS_CONSTANT * (1 / temperature - 1 / REFERENCE_TEMPERATURE))
+
+    def rate_matrix(self, temperature=REFERENCE_TEMPERATURE):
+        k = self.rate_constants(temperature)
+        index = np.arange(len(self.stages))
+        matrix = np.zeros(k.shape[:-1] + (self.species, self.species))
+        matrix[..., index, index] = -k
+        matrix[..., index + 1, index] = k
+        return matrix
+
+    def integrate(self, total_steps, temperature=REFERENCE_TEMPERATURE):
+        """Species fractions over one run of total_steps steps, starting with everything in the first species."""
+        matrix = self.rate_matrix(temperature)
+        y0 = np.zeros(matrix.shape[:-1])
+        y0[..., 0] = 1.0
+        return integrate_linear(matrix, y0, 1.0 / total_steps, total_steps)
+
+# "Linear" keeps the original constant-rate ramp; the rest integrate a ReactionChain
+KINETICS = {
+    "Linear": None,
+    "Exponential": ReactionChain([(5.0, 0.0)]),
+    "Arrhenius": ReactionChain([(5.0, 50_000.0)]),
+    "Two-Stage Chain": ReactionChain([(8.0, 0.0), (4.0, 0.0)]),
+    "Combustion Chain": ReactionChain([(12.0, 80_000.0), (6.0, 40_000.0), (3.0, 0.0)]),
+}
+
+# ==================== Parameter Sweeps ====================
+# In-process a grid point costs ~3 ns, while a pool adds ~100 ms of start-up plus a comparable
+# per-point cost to ship the float32 cube back, so only very large grids are split across processes
+SWEEP_POOL_THRESHOLD = 200_000_000
+
+class SweepResult:
+    """Effective fractions for every (transformation, rate, temperature, pressure) grid point."""
+    def __init__(self, initial_mass, transformations, rates, temperatures, pressures, fraction):
+        self.initial_mass = initial_mass
+        self.transformations = list(transformations)
+        self.rates = rates
+        self.temperatures = temperatures
+        self.pressures = pressures
+        self.fraction = fraction  # float32 cube, shape (T, R, K, P)
+
+    @property
+    def shape(self):
+        return self.fraction.shape
+
+    @property
+    def size(self):
+        return self.fraction.size
+
+    @property
+    def target_mass(self):
+        return self.initial_mass * self.fraction
+
+    @property
+    def energy(self):
+        return self.initial_mass * (1 - self.fraction) * (C ** 2)
+
+    def save(self, path):
+        np.savez(path, initial_mass=self.initial_mass, transformations=np.array(self.transformations),
+                 rates=self.rates, temperatures=self.temperatures, pressures=self.pressures, fraction=self.fraction)
+
+def parse_range(text):
+    """Parse "min,max,count" (or a single value) into a linspace grid."""
+    parts = [p.strip() for p in text.split(",") if p.strip()]
+    if len(parts) == 1:
+        return np.array([float(parts[0])])
+    if len(parts) != 3:
+        raise ValueError(f"Expected 'min,max,count', got {text!r}")
+    count = int(parts[2])
+    if count < 1:
+        raise ValueError("Range count must be at least 1.")
+    return np.linspace(float(parts[0]), float(parts[1]), count)
+
+def _sweep_block(transformation, base_fraction, rates, temperatures, pressures):
+    out = np.empty((len(rates), len(temperatures), len(pressures)), dtype=np.float32)
+    if transformation == "Nuclear Fusion":
+        out[...] = (0.3 * (rates / 100))[:, None, None]
+        return out
+    scaled = (base_fraction * (rates / 100))[:, None, None] * (temperatures / 300)[None, :, None]
+    np.multiply(scaled, (pressures / 1)[None, None, :], out=out)
+    np.minimum(out, 1, out=out)
+    return out
+
+def sweep_grid(initial_mass, transformations, rates, temperatures, pressures,
+               options=TRANSFORMATION_OPTIONS, workers=None):
+    """Evaluate the full Cartesian parameter grid; large grids are split across a process pool."""
+    rates = np.asarray(rates, dtype=np.float64)
+    temperatures = np.asarray(temperatures, dtype=np.float64)
+    pressures = np.asarray(pressures, dtype=np.float64)
+    transformations = list(transformations)
+    fraction = np.empty((len(transformations), len(rates), len(temperatures), len(pressures)), dtype=np.float32)
+
+    if workers is None:
+        workers = 1 if fraction.size < SWEEP_POOL_THRESHOLD else (os.cpu_count() or 1)
+    # One task per (transformation, rate chunk) keeps each worker's result small
+    n_chunks = max(1, min(len(rates), workers * 4))
+    tasks = []
+    for t_idx, name in enumerate(transformations):
+        for rate_idx in np.array_split(np.arange(len(rates)), n_chunks):
+            if len(rate_idx):
+                tasks.append((t_idx, rate_idx, (name, options[name], rates[rate_idx], temperatures, pressures)))
+
+    if workers <= 1:
+        for t_idx, rate_idx, args in tasks:
+            fraction[t_idx, rate_idx[0]:rate_idx[-1] + 1] = _sweep_block(*args)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(t_idx, rate_idx, pool.submit(_sweep_block, *args)) for t_idx, rate_idx, args in tasks]
+            for t_idx, rate_idx, future in futures:
+                fraction[t_idx, rate_idx[0]:rate_idx[-1] + 1] = future.result()
+    return SweepResult(initial_mass, transformations, rates, temperatures, pressures, fraction)
+
+# ==================== Monte Carlo ====================
+MONTE_CARLO_PERCENTILES = (5, 25, 50, 75, 95)
+MONTE_CARLO_POOL_THRESHOLD = 20_000_000  # Fewer (trajectory, step) points than this are cheaper in-process
+MONTE_CARLO_CHUNK = 8192  # Trajectories per task; bounds the float64 temporaries
+
+class MonteCarloResult:
+    """Percentile bands of the remaining mass over many runs with sampled inputs."""
+    def __init__(self, initial_mass, percentiles, bands, samples, final_remaining):
+        self.initial_mass = initial_mass
+        self.percentiles = tuple(percentiles)
+        self.bands = bands  # shape (len(percentiles), steps + 1)
+        self.samples = samples  # Sampled inputs by run_advanced argument name
+        self.final_remaining = final_remaining
+
+    @property
+    def size(self):
+        return len(self.final_remaining)
+
+    @property
+    def steps(self):
+        return np.arange(self.bands.shape[1])
+
+    def band(self, percentile):
+        return self.bands[self.percentiles.index(percentile)]
+
+    def save(self, path):
+        np.savez(path, initial_mass=self.initial_mass, percentiles=np.array(self.percentiles), bands=self.bands,
+                 final_remaining=self.final_remaining, **self.samples)
+
+def sample_parameters(samples, rate=(100.0, 0.0), temperature=(300.0, 0.0), pressure=(1.0, 0.0), seed=None):
+    """Draw each input from a normal (mean, standard deviation), clipped to stay positive."""
+    rng = np.random.default_rng(seed)
+    drawn = {}
+    for name, (mean, sd) in (("reaction_rate", rate), ("temperature", temperature), ("pressure", pressure)):
+        values = rng.normal(mean, sd, samples) if sd > 0 else np.full(samples, float(mean))
+        drawn[name] = np.maximum(values, 1e-9)
+    return drawn
+
+def _monte_carlo_block(initial_mass, transformation, base_fraction, rates, temperatures, pressures,
+                       total_steps, kinetics):
+    if transformation == "Nuclear Fusion":
+        fraction = 0.3 * (rates / 100)
+    else:
+        fraction = np.minimum(base_fraction * (rates / 100) * (temperatures / 300) * (pressures / 1), 1)
+    target = initial_mass * fraction
+    if kinetics == "Linear":
+        steps = np.arange(total_steps + 1)[:, None]
+        remaining = np.maximum(initial_mass - (initial_mass - target) / total_steps * steps, target)
+    else:
+        # Temperature-independent chains share one trajectory shape, so only Arrhenius stages integrate per sample
+        chain = KINETICS[kinetics]
+        product = chain.integrate(total_steps, temperatures if chain.temperature_dependent else REFERENCE_TEMPERATURE)
+        product = product[..., -1].reshape(total_steps + 1, -1)
+        remaining = initial_mass - (initial_mass - target) * product
+    return remaining.astype(np.float32)
+
+def monte_carlo(initial_mass, transformation, samples=20_000, rate=(100.0, 0.0), temperature=(300.0, 0.0),
+                pressure=(1.0, 0.0), total_steps=TOTAL_STEPS, kinetics="Linear", options=TRANSFORMATION_OPTIONS,
+                percentiles=MONTE_CARLO_PERCENTILES, seed=None, workers=None):
+    """Run `samples` trajectories with (mean, sd) inputs and reduce them to percentile bands."""
+    if initial_mass <= 0:
+        raise ValueError("Initial mass must be positive.")
+    if samples < 1:
+        raise ValueError("Monte Carlo needs at least one sample.")
+    if total_steps < 1:
+        raise ValueError("Steps must be at least 1.")
+    if kinetics not in KINETICS:
+        raise ValueError(f"Unknown kinetics {kinetics!r}.")
+    # Inputs are drawn up front so a seed gives the same result with any number of workers
+    drawn = sample_parameters(samples, rate, temperature, pressure, seed)
+    remaining = np.empty((total_steps + 1, samples), dtype=np.float32)
+    tasks = [(start, (initial_mass, transformation, options[transformation],
+                      drawn["reaction_rate"][start:start + MONTE_CARLO_CHUNK],
+                      drawn["temperature"][start:start + MONTE_CARLO_CHUNK],
+                      drawn["pressure"][start:start + MONTE_CARLO_CHUNK], total_steps, kinetics))
+             for start in range(0, samples, MONTE_CARLO_CHUNK)]
+
+    if workers is None:
+        workers = 1 if remaining.size < MONTE_CARLO_POOL_THRESHOLD else (os.cpu_count() or 1)
+    if workers <= 1:
+        for start, args in tasks:
+            remaining[:, start:start + MONTE_CARLO_CHUNK] = _monte_carlo_block(*args)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(start, pool.submit(_monte_carlo_block, *args)) for start, args in tasks]
+            for start, future in futures:
+                remaining[:, start:start + MONTE_CARLO_CHUNK] = future.result()
+    bands = np.percentile(remaining, percentiles, axis=1)
+    return MonteCarloResult(initial_mass, percentiles, bands, drawn, remaining[-1].copy())
+
+# ==================== Growable Buffers ====================
+class GrowableArray:
+    """1-D NumPy buffer with amortized O(1) appends; view() exposes the filled prefix without copying."""
+    def __init__(self, capacity=16, dtype=np.float64):
+        self._data = np.empty(max(int(capacity), 1), dtype=dtype)
+        self._size = 0
+
+    @classmethod
+    def wrap(cls, array):
+        """Adopt an existing 1-D array as a full buffer; it is only copied if appended to."""
+        buf = cls.__new__(cls)
+        buf._data = array
+        buf._size = len(array)
+        return buf
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    def _grow(self, min_capacity):
+        data = np.empty(max(min_capacity, 2 * len(self._data)), dtype=self._data.dtype)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+
+    def append(self, value):
+        if self._size == len(self._data):
+            self._grow(self._size + 1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        values = np.asarray(values)
+        end = self._size + len(values)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[self._size:end] = values
+        self._size = end
+
+    def view(self):
+        return self._data[:self._size]
+
+    def clear(self):
+        if not self._data.flags.writeable:  # Wrapped read-only data (cache entries, memory maps) is never reused
+            self._data = np.empty(len(self._data), dtype=self._data.dtype)
+        self._size = 0
+
+# ==================== Simulation Log ====================
+LOG_COLUMNS = ("step", "remaining", "converted", "energy")
+
+class SimulationLog:
+    """Columnar (step, remaining, converted, energy) store; rows read back as plain tuples."""
+    def __init__(self, capacity=16):
+        self._columns = [GrowableArray(capacity, dtype=np.int64)] + [GrowableArray(capacity) for _ in LOG_COLUMNS[1:]]
+
+    @classmethod
+    def from_columns(cls, step, remaining, converted, energy):
+        log = cls.__new__(cls)
+        log._columns = [GrowableArray.wrap(np.asarray(col)) for col in (step, remaining, converted, energy)]
+        if len({len(col) for col in log._columns}) != 1:
+            raise ValueError("All simulation log columns must have the same length.")
+        return log
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SimulationLog index out of range")
+        return self.rows(index, index + 1)[0]
+
+    def __iter__(self):
+        return iter(self.rows())
+
+    @property
+    def nbytes(self):
+        return sum(col.view().nbytes for col in self._columns)
+
+    def append(self, step, remaining, converted, energy):
+        for col, value in zip(self._columns, (step, remaining, converted, energy)):
+            col.append(value)
+
+    def extend(self, step, remaining, converted, energy):
+        for col, values in zip(self._columns, (step, remaining, converted, energy)):
+            col.extend(values)
+
+    def column(self, name):
+        return self._columns[LOG_COLUMNS.index(name)].view()
+
+    def columns(self):
+        return tuple(col.view() for col in self._columns)
+
+    def rows(self, start=0, stop=None):
+        # Only the requested slice is converted to Python objects
+        step = self._columns[0].view()[start:stop].astype(np.int64, copy=False).tolist()
+        return list(zip(step, *(col.view()[start:stop].tolist() for col in self._columns[1:])))
+
+    def clear(self):
+        for col in self._columns:
+            col.clear()
+
+# ==================== Data Plane ====================
+# int64 slots ahead of the shared columns; "total" is the run's full length, which exceeds "rows" once
+# the run outgrows the capacity and the remaining rows are not mirrored
+SHARED_HEADER = ("sequence", "epoch", "rows", "capacity", "total")
+SHARED_CAPACITY = 1 << 21  # Rows; pages are only committed by the OS as they are written
+_OWNED_SEGMENTS = set()  # Shared memory names this process created (and will unlink)
+
+class DataPlane:
+    """The run every viewer shows; its (epoch, rows) version lets each viewer process only what changed."""
+    def __init__(self, log=None):
+        self.log = SimulationLog() if log is None else log
+        self.epoch = 0
+        self.listeners = []
+
+    @property
+    def version(self):
+        return (self.epoch, len(self.log))
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def replace(self, log):
+        """Make `log` the current run; every viewer starts over from row 0."""
+        self.log = log
+        self.epoch += 1
+        self.notify()
+
+    def appended(self):
+        """Call after rows were appended to the current log in place."""
+        self.notify()
+
+    def changes(self, version):
+        """(reset, start, stop) since `version`: rows [start, stop) are new; reset means drop what was shown."""
+        rows = len(self.log)
+        if version is None or version[0] != self.epoch or version[1] > rows:
+            return True, 0, rows
+        return False, version[1], rows
+
+    def notify(self):
+        for callback in list(self.listeners):
+            callback(self)
+
+def _shared_views(shm):
+    header = np.ndarray(len(SHARED_HEADER), dtype=np.int64, buffer=shm.buf)
+    capacity = int(header[3])
+    columns = np.ndarray((len(LOG_COLUMNS), capacity), dtype=np.float64, buffer=shm.buf, offset=header.nbytes)
+    return header, columns
+
+class SharedLogMirror:
+    """Keeps a copy of a DataPlane's run in multiprocessing shared memory for SharedLogReader."""
+    def __init__(self, plane, name=None, capacity=SHARED_CAPACITY):
+        size = (len(SHARED_HEADER) + len(LOG_COLUMNS) * capacity) * 8
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _OWNED_SEGMENTS.add(self.shm.name)
+        np.ndarray(len(SHARED_HEADER), dtype=np.int64, buffer=self.shm.buf)[:] = (0, 0, 0, capacity, 0)
+        self.header, self.columns = _shared_views(self.shm)
+        self.plane = plane
+        self.version = None
+        plane.subscribe(self.sync)
+        self.sync(plane)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def capacity(self):
+        return len(self.columns[0])
+
+    @property
+    def truncated(self):
+        return len(self.plane.log) > self.capacity
+
+    def sync(self, plane):
+        reset, start, stop = plane.changes(self.version)
+        self.version = plane.version
+        stop = min(stop, len(self.columns[0]))  # Rows past capacity are not mirrored
+        if reset:
+            # Seqlock: an odd sequence tells readers the rows are being rewritten
+            self.header[0] += 1
+            self.header[1] = plane.epoch
+            self.header[2] = 0
+        for dest, col in zip(self.columns, plane.log.columns()):
+            dest[start:stop] = col[start:stop]
+        # Rows below the published count never change within an epoch, so appends need no seqlock
+        self.header[4] = len(plane.log)
+        self.header[2] = stop
+        if reset:
+            self.header[0] += 1
+
+    def close(self):
+        self.plane.unsubscribe(self.sync)
+        del self.header, self.columns  # Views must go before the mapping can close
+        self.shm.close()
+        self.shm.unlink()
+        _OWNED_SEGMENTS.discard(self.shm.name)
+
+class SharedLogReader:
+    """Out-of-process view of a SharedLogMirror, with the same version/changes() protocol as DataPlane."""
+    def __init__(self, name):
+        self.shm = shared_memory.SharedMemory(name=name)
+        # Only the creating process may unlink the block; stop this process's tracker from doing it at exit
+        if self.shm.name not in _OWNED_SEGMENTS:
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+        self.header, self.columns = _shared_views(self.shm)
+
+    @property
+    def version(self):
+        while True:
+            sequence = int(self.header[0])
+            epoch, rows = int(self.header[1]), int(self.header[2])
+            if sequence % 2 == 0 and sequence == int(self.header[0]):
+                return (epoch, rows)
+            time.sleep(0.0005)
+
+    @property
+    def total_rows(self):
+        """Length of the writer's run, including rows past capacity that were not mirrored."""
+        return int(self.header[4])
+
+    @property
+    def truncated(self):
+        return self.total_rows > int(self.header[3])
+
+    def changes(self, version):
+        epoch, rows = self.version
+        if version is None or version[0] != epoch or version[1] > rows:
+            return True, 0, rows
+        return False, version[1], rows
+
+    def log(self, rows=None):
+        """Zero-copy, read-only log of the first `rows` rows; the writer reuses them when a new run starts."""
+        rows = self.version[1] if rows is None else rows
+        columns = self.columns[:, :rows]
+        columns.flags.writeable = False
+        return SimulationLog.from_columns(*columns)
+
+    def close(self):
+        del self.header, self.columns
+        self.shm.close()
+
+# ==================== Export ====================
+EXPORT_CHUNK_ROWS = 50_000
+CSV_HEADER = ["Step", "Remaining Mass (kg)", "Converted Mass (kg)", "Energy (Joules)"]
+JSON_ROW_TEMPLATE = ('    {\n        "Step": %r,\n        "Remaining Mass": %r,\n'
+                     '        "Converted Mass": %r,\n        "Energy": %r\n    }')
+
+def iter_row_chunks(log, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield (rows_done, total, rows) over a snapshot of the log taken when iteration starts."""
+    total = len(log)  # Rows before this index never change, even if the log grows meanwhile
+    for start in range(0, total, chunk_rows):
+        rows = log.rows(start, min(start + chunk_rows, total))
+        yield start + len(rows), total, rows
+
+def export_csv(log, path, progress=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    with open(path, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADER)
+        for done, total, rows in iter_row_chunks(log, chunk_rows):
+            writer.writerows(rows)
+            if progress:
+                progress(done, total)
+
+def export_json(log, path, progress=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    # Streams the same layout json.dump(rows, indent=4) would produce, one chunk at a time
+    with open(path, mode="w") as file:
+        if not len(log):
+            file.write("[]")
+            return
+        file.write("[\n")
+        for done, total, rows in iter_row_chunks(log, chunk_rows):
+            file.write(",\n".join(JSON_ROW_TEMPLATE % row for row in rows))
+            file.write("\n]" if done == total else ",\n")
+            if progress:
+                progress(done, total)
+
+def export_npy(log, path, progress=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    # Columnar float64 array of shape (4, rows): each column is contiguous on disk and memory-mappable
+    # Written beside the target and swapped in, since the log may be a memory map of the file being replaced
+    total = len(log)
+    tmp_path = path + f".{os.getpid()}.tmp"
+    out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float64, shape=(len(LOG_COLUMNS), total))
+    try:
+        columns = log.columns()
+        for start in range(0, total, chunk_rows):
+            stop = min(start + chunk_rows, total)
+            for i, col in enumerate(columns):
+                out[i, start:stop] = col[start:stop]
+            if progress:
+                progress(stop, total)
+        out.flush()
+    except BaseException:
+        del out
+        os.remove(tmp_path)
+        raise
+    del out
+    os.replace(tmp_path, path)
+
+def load_npy(path):
+    """Open a run written by export_npy() as a memory-mapped, zero-copy SimulationLog."""
+    data = np.load(path, mmap_mode="r")
+    if data.ndim != 2 or data.shape[0] != len(LOG_COLUMNS):
+        raise ValueError(f"{path} is not a simulation log (expected shape (4, N), got {data.shape}).")
+    return SimulationLog.from_columns(*data)
+
+# ==================== Level of Detail ====================
+def decimate_minmax(values, budget, start=0, stop=None):
+    """Indices of the per-bucket min and max of values[start:stop], about `budget` in total."""
+    # Keeping the envelope means spikes survive; reshaping a slice never copies memory-mapped columns
+    stop = len(values) if stop is None else stop
+    count = stop - start
+    if count <= budget:
+        return np.arange(start, stop)
+    bucket = -(-count // max(budget // 2, 1))  # Ceiling division
+    full = count // bucket * bucket
+    blocks = values[start:start + full].reshape(-1, bucket)
+    offsets = np.arange(0, full, bucket)
+    picks = [offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1), [0, count - 1]]
+    if full < count:
+        tail = values[start + full:stop]
+        picks.append([full + tail.argmin(), full + tail.argmax()])
+    return start + np.unique(np.concatenate(picks))
+
+# ==================== Upload ====================
+UPLOAD_BATCH_ROWS = 20_000
+UPLOAD_MAX_BATCH_BYTES = 1 << 20  # Compressed request body limit
+
+class UploadInterrupted(Exception):
+    """Raised when a batch still fails after all retries; `offset` is where to resume."""
+    def __init__(self, offset, cause):
+        super().__init__(f"Upload stopped at row {offset}: {cause}")
+        self.offset = offset
+        self.cause = cause
+
+def encode_batch(log, start, stop):
+    payload = {
+        "offset": start,
+        "total": len(log),
+        "columns": {name: (col[start:stop].astype(np.int64) if name == "step" else col[start:stop]).tolist()
+                    for name, col in zip(LOG_COLUMNS, log.columns())},
+    }
+    return gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+def upload_log(session, url, log, start=0, batch_rows=UPLOAD_BATCH_ROWS, max_batch_bytes=UPLOAD_MAX_BATCH_BYTES,
+               retries=4, backoff=0.5, timeout=10, progress=None, cancel=None):
+    """POST the log from row `start` in gzip-compressed JSON batches; returns the compressed bytes sent."""
+    # Setting the `cancel` event stops the upload between batches and retries, raising UploadInterrupted
+    total = len(log)
+    offset = start
+    bytes_sent = 0
+    while offset < total:
+        if cancel is not None and cancel.is_set():
+            raise UploadInterrupted(offset, "cancelled")
+        rows = min(batch_rows, total - offset)
+        body = encode_batch(log, offset, offset + rows)
+        while len(body) > max_batch_bytes and rows > 1:
+            rows //= 2
+            body = encode_batch(log, offset, offset + rows)
+        batch_rows = rows  # Later batches start from the size that fit
+        headers = {"Content-Type": "application/json", "Content-Encoding": "gzip",
+                   "X-Zahoor-Offset": str(offset), "X-Zahoor-Total": str(total)}
+        for attempt in range(retries + 1):
+            try:
+                response = session.post(url, data=body, headers=headers, timeout=timeout)
+            except OSError as e:  # Connection errors and timeouts; requests' exceptions derive from IOError
+                error = e
+            else:
+                if response.status_code < 400:
+                    break
+                error = f"HTTP {response.status_code}"
+                if response.status_code < 500:
+                    raise UploadInterrupted(offset, error)  # Client errors won't improve by retrying
+            if attempt == retries:
+                raise UploadInterrupted(offset, error)
+            if cancel is None:
+                time.sleep(backoff * 2 ** attempt)
+            elif cancel.wait(backoff * 2 ** attempt):
+                raise UploadInterrupted(offset, "cancelled")
+        offset += rows
+        bytes_sent += len(body)
+        if progress:
+            progress(offset, total)
+    return bytes_sent
+
+# ==================== Live Streaming ====================
+STREAM_PORT = 5757
+STREAM_FRAME = struct.Struct("<BI")  # Message type, payload length
+STREAM_START, STREAM_ROWS, STREAM_END = 1, 2, 3
+STREAM_CLIENT_BACKLOG = 1024  # Messages queued for one subscriber before it is dropped as stalled
+
+def pack_message(kind, payload):
+    return STREAM_FRAME.pack(kind, len(payload)) + payload
+
+def pack_rows(columns):
+    # Rows travel as little-endian float64 (step, remaining, converted, energy), like export_npy()
+    return pack_message(STREAM_ROWS, np.column_stack(columns).astype("<f8").tobytes())
+
+class StepPublisher:
+    """Broadcasts the rows of a live run to local TCP subscribers as they are produced."""
+    def __init__(self, host="127.0.0.1", port=STREAM_PORT):
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()
+        self.lock = threading.RLock()
+        self.clients = {}  # outbox queue -> socket
+        self.log = None
+        self.meta = None
+        self.published = 0
+        self.accept_thread = threading.Thread(target=self.accept_loop, daemon=True)
+        self.accept_thread.start()
+
+    @property
+    def subscribers(self):
+        return len(self.clients)
+
+    def accept_loop(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return  # Server closed
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            outbox = queue.Queue(STREAM_CLIENT_BACKLOG)
+            with self.lock:
+                # A late subscriber first gets the run so far, up to exactly the rows already broadcast
+                if self.log is not None:
+                    outbox.put(pack_message(STREAM_START, json.dumps(self.meta).encode("utf-8")))
+                    if self.published:
+                        outbox.put(pack_rows([col[:self.published] for col in self.log.columns()]))
+                self.clients[outbox] = conn
+            threading.Thread(target=self.send_loop, args=(conn, outbox), daemon=True).start()
+
+    def send_loop(self, conn, outbox):
+        with conn:
+            while True:
+                message = outbox.get()
+                if message is None:
+                    break
+                try:
+                    conn.sendall(message)
+                except OSError:
+                    break
+        with self.lock:
+            self.clients.pop(outbox, None)
+
+    def broadcast(self, message):
+        with self.lock:
+            for outbox, conn in list(self.clients.items()):
+                try:
+                    outbox.put_nowait(message)
+                except queue.Full:
+                    # A stalled subscriber is cut off rather than allowed to hold back the simulation
+                    del self.clients[outbox]
+                    self.disconnect(conn)
+
+    @staticmethod
+    def disconnect(conn):
+        # Unblocks the subscriber's send_loop, which then closes the socket
+        try:
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def begin(self, log, **meta):
+        """Start streaming a run; `log` is read from as publish() is called after it grows."""
+        with self.lock:
+            self.log = log
+            self.meta = meta
+            self.published = 0
+            self.broadcast(pack_message(STREAM_START, json.dumps(meta).encode("utf-8")))
+
+    def publish(self):
+        with self.lock:
+            if self.log is None or len(self.log) <= self.published:
+                return
+            stop = len(self.log)
+            self.broadcast(pack_rows([col[self.published:stop] for col in self.log.columns()]))
+            self.published = stop
+
+    def end(self, status="completed"):
+        with self.lock:
+            if self.log is None:
+                return
+            self.publish()
+            info = {"status": status, "rows": self.published}
+            self.broadcast(pack_message(STREAM_END, json.dumps(info).encode("utf-8")))
+            self.log = None
+
+    def close(self):
+        # close() alone leaves accept() blocked and the port bound; shutdown wakes it first
+        self.disconnect(self.server)
+        self.server.close()
+        self.accept_thread.join()
+        with self.lock:
+            for outbox, conn in list(self.clients.items()):
+                try:
+                    outbox.put_nowait(None)
+                except queue.Full:
+                    self.disconnect(conn)
+
+class StepSubscriber:
+    """Client for StepPublisher; iterating yields ("start", meta), ("rows", (n, 4) array) and ("end", info)."""
+    def __init__(self, host="127.0.0.1", port=STREAM_PORT, timeout=None):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.file = self.sock.makefile("rb")
+
+    def __iter__(self):
+        kinds = {STREAM_START: "start", STREAM_END: "end"}
+        while True:
+            header = self.file.read(STREAM_FRAME.size)
+            if len(header) < STREAM_FRAME.size:
+                return  # Publisher closed
+            kind, length = STREAM_FRAME.unpack(header)
+            payload = self.file.read(length)
+            if len(payload) < length:
+                return
+            if kind == STREAM_ROWS:
+                yield "rows", np.frombuffer(payload, dtype="<f8").reshape(-1, len(LOG_COLUMNS))
+            elif kind in kinds:
+                yield kinds[kind], json.loads(payload)
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ==================== Result Cache ====================
+RESULT_CACHE_MAX_BYTES = 256 * 2**20  # A 1M-step trajectory is 32 MB
+
+class ResultCache:
+    """LRU of trajectories keyed by run parameters, optionally persisted as .npy files."""
+    def __init__(self, max_entries=128, max_bytes=RESULT_CACHE_MAX_BYTES, directory=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes  # Per process: every pool worker holds its own cache
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.nbytes = 0
+
+    @staticmethod
+    def key(initial_mass, target_mass, total_steps, kinetics="Linear", temperature=300.0):
+        # The trajectory depends on nothing else, so different inputs with the same target share an entry;
+        # linear runs keep the original three-part key so existing disk entries stay valid
+        key = (float(initial_mass), float(target_mass), int(total_steps))
+        if kinetics == "Linear":
+            return key
+        chain = KINETICS[kinetics]
+        temperature = float(temperature) if chain.temperature_dependent else REFERENCE_TEMPERATURE
+        return key + (tuple(chain.stages), temperature)
+
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(repr(key).encode()).hexdigest()[:24] + ".npy")
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if self.directory is not None and os.path.exists(self.path(key)):
+            try:
+                columns = tuple(np.load(self.path(key), mmap_mode="r"))
+            except (OSError, ValueError):
+                return None  # Unreadable entry: recompute and overwrite it
+            self.remember(key, columns)
+            return columns
+        return None
+
+    def put(self, key, columns):
+        for col in columns:
+            col.flags.writeable = False  # Entries are shared between callers
+        self.remember(key, columns)
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self.path(key) + f".{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as file:
+                np.save(file, np.vstack(columns).astype(np.float64))
+            os.replace(tmp_path, self.path(key))  # Atomic, so concurrent processes never see half a file
+
+    def remember(self, key, columns):
+        size = sum(col.nbytes for col in columns)
+        if key in self.entries:
+            self.nbytes -= sum(col.nbytes for col in self.entries.pop(key))
+        if size > self.max_bytes:
+            return  # Too large to keep in memory; the caller still has it and the disk copy, if any
+        self.entries[key] = columns
+        self.nbytes += size
+        while len(self.entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= sum(col.nbytes for col in evicted)
+
+    def trajectory(self, initial_mass, target_mass, total_steps=TOTAL_STEPS, kinetics="Linear", temperature=300.0):
+        key = self.key(initial_mass, target_mass, total_steps, kinetics, temperature)
+        columns = self.get(key)
+        if columns is None:
+            columns = simulate_trajectory(initial_mass, target_mass, total_steps, kinetics, temperature)
+            self.put(key, columns)
+        return columns
+
+# Set ZAHOOR_CACHE_DIR to keep results across restarts (and share them between worker processes)
+RESULT_CACHE = ResultCache(directory=os.environ.get("ZAHOOR_CACHE_DIR"))
+
+# ==================== Library API ====================
+def run_advanced(initial_mass, transformation, reaction_rate=100.0, temperature=300.0, pressure=1.0,
+                 total_steps=TOTAL_STEPS, options=TRANSFORMATION_OPTIONS, kinetics="Linear"):
+    """Advanced Mass Tracker run as a SimulationLog."""
+    if initial_mass <= 0:
+        raise ValueError("Initial mass must be positive.")
+    if total_steps < 1:
+        raise ValueError("Steps must be at least 1.")
+    if kinetics not in KINETICS:
+        raise ValueError(f"Unknown kinetics {kinetics!r}.")
+    fraction = effective_fraction(transformation, options[transformation], reaction_rate, temperature, pressure)
+    return SimulationLog.from_columns(*RESULT_CACHE.trajectory(initial_mass, initial_mass * fraction, total_steps,
+                                                               kinetics, temperature))
+
+def run_historical(initial_mass, transformation, total_steps=TOTAL_STEPS, options=HISTORICAL_OPTIONS,
+                   kinetics="Linear"):
+    """Historical Simulation run as a SimulationLog."""
+    if initial_mass <= 0:
+        raise ValueError("Initial mass must be positive.")
+    if total_steps < 1:
+        raise ValueError("Steps must be at least 1.")
+    if kinetics not in KINETICS:
+        raise ValueError(f"Unknown kinetics {kinetics!r}.")
+    target_mass = initial_mass * options[transformation]
+    return SimulationLog.from_columns(*RESULT_CACHE.trajectory(initial_mass, target_mass, total_steps, kinetics))
+
+def run_job(spec):
+    """Run one job spec: {"kind": "advanced" | "historical", **run_advanced/run_historical kwargs}."""
+    params = dict(spec)
+    kind = params.pop("kind", "advanced")
+    if kind == "advanced":
+        return run_advanced(**params)
+    if kind == "historical":
+        return run_historical(**params)
+    raise ValueError(f"Unknown job kind {kind!r}.")
+
+class JobRunner:
+    """Runs many job specs across a process pool; results come back in submission order."""
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self, specs, progress=None):
+        # A failing job yields its exception in place of a log so the rest of the batch still completes
+        specs = list(specs)
+        results = [None] * len(specs)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(run_job, spec): i for i, spec in enumerate(specs)}
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = e
+                if progress:
+                    progress(done, len(specs), specs[index])
+        return results
+
+EXPORTERS = {".csv": export_csv, ".json": export_json, ".npy": export_npy}
+
+def save_log(log, path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORTERS:
+        raise ValueError(f"Unsupported output format {extension!r}; use one of {', '.join(EXPORTERS)}.")
+    EXPORTERS[extension](log, path)
+
+# ==================== Command Line ====================
+def build_parser():
+    parser = argparse.ArgumentParser(prog="zahoor_engine", description="Headless Eternal Zahoor Simulator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert a mass to its energy equivalent (E=mc^2).")
+    convert.add_argument("mass", type=float, help="Mass in kg.")
+
+    for name, options, help_text in (("advanced", TRANSFORMATION_OPTIONS, "Advanced Mass Tracker run."),
+                                      ("historical", HISTORICAL_OPTIONS, "Historical Simulation run.")):
+        cmd = commands.add_parser(name, help=help_text)
+        cmd.add_argument("--mass", type=float, default=70.0, help="Initial mass in kg (default: 70).")
+        cmd.add_argument("--transformation", choices=list(options), default="Fusion")
+        cmd.add_argument("--steps", type=int, default=TOTAL_STEPS, help=f"Simulation steps (default: {TOTAL_STEPS}).")
+        cmd.add_argument("--kinetics", choices=list(KINETICS), default="Linear", help="Rate model (default: Linear).")
+        cmd.add_argument("-o", "--output", help="Write the run to a .csv, .json or .npy file.")
+        if name == "advanced":
+            cmd.add_argument("--rate", type=float, default=100.0, help="Reaction rate in %% (default: 100).")
+            cmd.add_argument("--temperature", type=float, default=300.0, help="Temperature in K (default: 300).")
+            cmd.add_argument("--pressure", type=float, default=1.0, help="Pressure in atm (default: 1).")
+
+    batch = commands.add_parser("batch", help="Run a JSON list of job specs across all cores.")
+    batch.add_argument("jobs", help='JSON file: [{"kind": "historical", "initial_mass": 70, ...}, ...]')
+    batch.add_argument("--workers", type=int, help="Worker processes (default: one per core).")
+    batch.add_argument("-o", "--output-dir", help="Write each run to OUTPUT_DIR/job_NNNNN.npy.")
+
+    sweep = commands.add_parser("sweep", help="Evaluate a transformation x rate x temperature x pressure grid.")
+    sweep.add_argument("--mass", type=float, default=70.0)
+    sweep.add_argument("--transformations", nargs="+", choices=list(TRANSFORMATION_OPTIONS),
+                       default=list(TRANSFORMATION_OPTIONS))
+    sweep.add_argument("--rates", default="50,150,101", help="min,max,count (default: 50,150,101).")
+    sweep.add_argument("--temperatures", default="200,400,101", help="min,max,count (default: 200,400,101).")
+    sweep.add_argument("--pressures", default="0.5,2,101", help="min,max,count (default: 0.5,2,101).")
+    sweep.add_argument("--workers", type=int, help="Worker processes (default: automatic).")
+    sweep.add_argument("-o", "--output", help="Write the result cube to a .npz file.")
+
+    subscribe = commands.add_parser("subscribe", help="Print rows streamed live from a running app as CSV.")
+    subscribe.add_argument("--host", default="127.0.0.1")
+    subscribe.add_argument("--port", type=int, default=STREAM_PORT, help=f"Publisher port (default: {STREAM_PORT}).")
+    subscribe.add_argument("--once", action="store_true", help="Exit when the first run ends.")
+
+    mc = commands.add_parser("montecarlo", help="Percentile bands over runs with normally distributed inputs.")
+    mc.add_argument("--mass", type=float, default=70.0, help="Initial mass in kg (default: 70).")
+    mc.add_argument("--transformation", choices=list(TRANSFORMATION_OPTIONS), default="Fusion")
+    mc.add_argument("--kinetics", choices=list(KINETICS), default="Linear", help="Rate model (default: Linear).")
+    mc.add_argument("--steps", type=int, default=TOTAL_STEPS, help=f"Simulation steps (default: {TOTAL_STEPS}).")
+    mc.add_argument("--rate", type=float, nargs=2, default=[100.0, 10.0], metavar=("MEAN", "SD"),
+                    help="Reaction rate in %% (default: 100 10).")
+    mc.add_argument("--temperature", type=float, nargs=2, default=[300.0, 15.0], metavar=("MEAN", "SD"),
+                    help="Temperature in K (default: 300 15).")
+    mc.add_argument("--pressure", type=float, nargs=2, default=[1.0, 0.05], metavar=("MEAN", "SD"),
+                    help="Pressure in atm (default: 1 0.05).")
+    mc.add_argument("--samples", type=int, default=20_000, help="Trajectories to run (default: 20000).")
+    mc.add_argument("--seed", type=int, help="Random seed for reproducible samples.")
+    mc.add_argument("--workers", type=int, help="Worker processes (default: automatic).")
+    mc.add_argument("-o", "--output", help="Write the bands and samples to a .npz file.")
+    return parser
+
+def run_batch(args):
+    with open(args.jobs) as file:
+        specs = json.load(file)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    progress = lambda done, total, spec: print(f"\rJobs: {done}/{total}", end="", file=sys.stderr)
+    results = JobRunner(args.workers).run(specs, progress=progress)
+    print(file=sys.stderr)
+    failed = 0
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"job {index}: error: {result}", file=sys.stderr)
+        elif args.output_dir:
+            export_npy(result, os.path.join(args.output_dir, f"job_{index:05d}.npy"))
+    print(f"{len(results) - failed}/{len(results)} jobs completed.")
+    return 1 if failed else 0
+
+def run_subscribe(args):
+    writer = csv.writer(sys.stdout)
+    with StepSubscriber(args.host, args.port) as subscriber:
+        for kind, payload in subscriber:
+            if kind == "start":
+                print(f"run started: {json.dumps(payload)}", file=sys.stderr)
+                writer.writerow(CSV_HEADER)
+            elif kind == "rows":
+                writer.writerows([int(row[0]), *row[1:].tolist()] for row in payload)
+                sys.stdout.flush()
+            else:
+                print(f"run {payload['status']} after {payload['rows']} rows", file=sys.stderr)
+                if args.once:
+                    break
+    return 0
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == "convert":
+            print(f"Energy: {mass_to_energy(args.mass):.2e} Joules")
+            return 0
+        if args.command == "sweep":
+            result = sweep_grid(args.mass, args.transformations, parse_range(args.rates),
+                                parse_range(args.temperatures), parse_range(args.pressures), workers=args.workers)
+            energy = result.energy
+            print(f"Sweep: {result.size:,} points | Energy {energy.min():.2e} - {energy.max():.2e} J")
+            if args.output:
+                result.save(args.output)
+            return 0
+        if args.command == "montecarlo":
+            result = monte_carlo(args.mass, args.transformation, args.samples, tuple(args.rate),
+                                 tuple(args.temperature), tuple(args.pressure), args.steps, args.kinetics,
+                                 seed=args.seed, workers=args.workers)
+            finals = ", ".join(f"P{p}: {band[-1]:.2f}" for p, band in zip(result.percentiles, result.bands))
+            print(f"{args.transformation}: {result.size:,} runs | Remaining Mass (kg) {finals}")
+            if args.output:
+                result.save(args.output)
+            return 0
+        if args.command == "batch":
+            return run_batch(args)
+        if args.command == "subscribe":
+            return run_subscribe(args)
+        if args.command == "advanced":
+            log = run_advanced(args.mass, args.transformation, args.rate, args.temperature, args.pressure, args.steps,
+                               kinetics=args.kinetics)
+        else:
+            log = run_historical(args.mass, args.transformation, args.steps, kinetics=args.kinetics)
+        step, remaining, converted, energy = log[-1]
+        print(f"{args.transformation}: {step} steps | Remaining Mass: {remaining:.2f} kg | Energy: {energy:.2e} J")
+        if args.output:
+            save_log(log, args.output)
+        return 0
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())